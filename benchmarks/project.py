@@ -0,0 +1,116 @@
+import os
+
+FIELD_TEMPLATES = [
+    "models.CharField(max_length=100)",
+    "models.IntegerField(default=0)",
+    "models.BooleanField(default=False)",
+    "models.DateTimeField(auto_now_add=True)",
+    "models.DateField(null=True)",
+    "models.DecimalField(max_digits=10, decimal_places=2, default=0)",
+    "models.UUIDField(null=True)",
+    "models.JSONField(default=dict)",
+    "models.FileField(blank=True)",
+    "models.TextField(blank=True)",
+]
+
+CHOICES = [
+    ("Status", ["draft", "review", "published", "archived"]),
+    ("Currency", ["usd", "eur", "brl", "gbp", "jpy", "chf"]),
+    ("Priority", ["low", "medium", "high"]),
+]
+
+
+def app_label(index):
+    return f"bench_app_{index}"
+
+
+def model_name(index):
+    return f"Model{index}"
+
+
+def render_models(app_index, apps, models, fields):
+    label = app_label(app_index)
+    lines = ["from django.db import models", ""]
+
+    for choices_name, values in CHOICES:
+        lines.append(f"class {choices_name}(models.TextChoices):")
+        for value in values:
+            lines.append(f'    {value.upper()} = "{value}", "{value.title()}"')
+        lines.append("")
+
+    for model_index in range(models):
+        lines.append(f"class {model_name(model_index)}(models.Model):")
+        for field_index in range(fields):
+            template = FIELD_TEMPLATES[field_index % len(FIELD_TEMPLATES)]
+            lines.append(f"    field_{field_index} = {template}")
+
+        choices_name = CHOICES[model_index % len(CHOICES)][0]
+        lines.append(
+            f"    kind = models.CharField(max_length=20, choices={choices_name}.choices)"
+        )
+        if model_index > 0:
+            lines.append(
+                f'    parent = models.ForeignKey("{label}.{model_name(model_index - 1)}", '
+                'on_delete=models.CASCADE, null=True, related_name="+")'
+            )
+        # Relations into the previous app build a web across apps.
+        other = app_label((app_index - 1) % apps)
+        lines.append(
+            f'    links = models.ManyToManyField("{other}.{model_name(model_index)}", '
+            'related_name="+")'
+        )
+        lines.append("")
+        lines.append("    class Meta:")
+        lines.append(f'        app_label = "{label}"')
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def render_serializers(app_index, models):
+    lines = [
+        "from rest_framework import serializers",
+        "from . import models",
+        "",
+    ]
+
+    for model_index in range(models):
+        name = model_name(model_index)
+        lines.append(f"class {name}Serializer(serializers.ModelSerializer):")
+        if model_index > 0:
+            lines.append(
+                f"    parent = {model_name(model_index - 1)}Serializer(read_only=True)"
+            )
+        lines.append("    kind_label = serializers.SerializerMethodField()")
+        lines.append("    summary = serializers.SerializerMethodField()")
+        lines.append("")
+        lines.append("    class Meta:")
+        lines.append(f"        model = models.{name}")
+        lines.append('        fields = "__all__"')
+        lines.append("")
+        lines.append("    def get_kind_label(self, obj) -> str:")
+        lines.append("        return obj.get_kind_display()")
+        lines.append("")
+        lines.append("    def get_summary(self, obj):")
+        lines.append('        return {"id": obj.pk, "kind": obj.kind}')
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(root, apps, models, fields):
+    """Write ``apps`` synthetic apps with ``models`` models of ``fields`` fields."""
+    labels = []
+    for app_index in range(apps):
+        label = app_label(app_index)
+        app_dir = os.path.join(root, label)
+        os.makedirs(app_dir, exist_ok=True)
+
+        with open(os.path.join(app_dir, "__init__.py"), "w") as f:
+            f.write("")
+        with open(os.path.join(app_dir, "models.py"), "w") as f:
+            f.write(render_models(app_index, apps, models, fields))
+        with open(os.path.join(app_dir, "serializers.py"), "w") as f:
+            f.write(render_serializers(app_index, models))
+        labels.append(label)
+    return labels
@@ -0,0 +1,230 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+import importlib
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+# name: (apps, models per app, fields per model)
+SCENARIOS = {
+    "small": (5, 10, 8),
+    "medium": (20, 20, 12),
+    "large": (60, 30, 15),
+}
+DEFAULT_SCENARIOS = ["small", "medium"]
+
+# Timings below this difference (seconds) are treated as noise.
+MIN_TIME_DELTA = 0.025
+# Write (and so total) times mostly measure the disk of the machine, so only
+# these metrics are checked against the baseline.
+COMPARED_METRICS = ("setup", ".import", ".render", ".peak_memory_kb")
+
+
+class TimingSink:
+    def __init__(self, sink):
+        self.sink = sink
+        self.seconds = 0.0
+        self.files = 0
+        self.bytes = 0
+
+    def write(self, relpath, content):
+        started = time.perf_counter()
+        self.sink.write(relpath, content)
+        self.seconds += time.perf_counter() - started
+        self.files += 1
+        self.bytes += len(content.encode("utf-8"))
+
+    def close(self):
+        return self.sink.close()
+
+
+def measure(exporter_class, labels, outdir):
+    from django.apps import apps
+    from django_ts_exporter.sinks import FileSystemSink
+
+    results = {"import": 0.0}
+    exporter = exporter_class(outdir, labels, False)
+
+    if hasattr(exporter, "find_serializer_modules"):
+        started = time.perf_counter()
+        for label in labels:
+            app_config = apps.get_app_config(label)
+            for module_name in exporter.find_serializer_modules(app_config):
+                importlib.import_module(module_name)
+        results["import"] = time.perf_counter() - started
+
+    sink = TimingSink(FileSystemSink(os.path.join(outdir, "timed")))
+    exporter = exporter_class(outdir, labels, False, sink=sink)
+    started = time.perf_counter()
+    exporter.export()
+    export_seconds = time.perf_counter() - started
+
+    results["render"] = export_seconds - sink.seconds
+    results["write"] = sink.seconds
+    results["total"] = results["import"] + export_seconds
+    results["files"] = sink.files
+    results["bytes"] = sink.bytes
+
+    # Memory is traced in a separate run; tracing slows down the timed one.
+    exporter = exporter_class(os.path.join(outdir, "traced"), labels, False)
+    tracemalloc.start()
+    exporter.export()
+    results["peak_memory_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+    tracemalloc.stop()
+    return results
+
+
+def run_worker(apps, models, fields):
+    from benchmarks.project import generate_project
+
+    with tempfile.TemporaryDirectory() as root:
+        labels = generate_project(root, apps, models, fields)
+        sys.path.insert(0, root)
+
+        started = time.perf_counter()
+        import django
+        from django.conf import settings
+
+        settings.configure(
+            BASE_DIR=root,
+            INSTALLED_APPS=["django.contrib.contenttypes"] + labels,
+            DATABASES={},
+        )
+        django.setup()
+        results = {"setup": time.perf_counter() - started}
+
+        from django_ts_exporter.models_exporter import ModelsExporter
+        from django_ts_exporter.serializers_exporter import SerializersExporter
+
+        for source, exporter_class in (
+            ("models", ModelsExporter),
+            ("serializers", SerializersExporter),
+        ):
+            outdir = os.path.join(root, "typescript", source)
+            for metric, value in measure(exporter_class, labels, outdir).items():
+                results[f"{source}.{metric}"] = value
+
+    print(json.dumps(results))
+
+
+def run_scenario(apps, models, fields, repeat):
+    runs = []
+    for _ in range(repeat):
+        # Every run gets a fresh interpreter, so Django and the imports are cold.
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--worker"]
+            + [str(apps), str(models), str(fields)],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        metric: statistics.median(run[metric] for run in runs) for metric in runs[0]
+    }
+
+
+def compare(name, results, baseline, tolerance):
+    regressions = []
+    for metric, value in results.items():
+        expected = baseline.get(metric)
+        if expected is None or not metric.endswith(COMPARED_METRICS):
+            continue
+        if value > expected * (1 + tolerance):
+            if metric.endswith("_kb") or value - expected > MIN_TIME_DELTA:
+                regressions.append(f"{name} {metric}: {expected:.3f} -> {value:.3f}")
+    return regressions
+
+
+def print_results(name, apps, models, fields, results):
+    print(f"\n{name}: {apps} apps x {models} models x {fields} fields")
+    print(f"  setup: {results['setup'] * 1000:.1f} ms")
+    for source in ("models", "serializers"):
+        print(
+            f"  {source}: total {results[f'{source}.total'] * 1000:.1f} ms "
+            f"(import {results[f'{source}.import'] * 1000:.1f}, "
+            f"render {results[f'{source}.render'] * 1000:.1f}, "
+            f"write {results[f'{source}.write'] * 1000:.1f}), "
+            f"{results[f'{source}.files']:.0f} files, "
+            f"peak {results[f'{source}.peak_memory_kb']:.0f} KiB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark django-ts-exporter on synthetic Django projects.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--scenario",
+        nargs="*",
+        choices=sorted(SCENARIOS),
+        default=DEFAULT_SCENARIOS,
+        help="Predefined project sizes to benchmark.",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        nargs=3,
+        metavar=("APPS", "MODELS", "FIELDS"),
+        help="Benchmark a custom project size instead of the scenarios.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario.")
+    parser.add_argument(
+        "--baseline", default=BASELINE_PATH, help="Baseline file to compare against."
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the new baseline."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown before a metric counts as a regression.",
+    )
+    parser.add_argument("--worker", type=int, nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(*args.worker)
+        return
+
+    if args.size:
+        scenarios = {"custom": tuple(args.size)}
+    else:
+        scenarios = {name: SCENARIOS[name] for name in args.scenario}
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    regressions = []
+    for name, (apps, models, fields) in scenarios.items():
+        results = run_scenario(apps, models, fields, args.repeat)
+        print_results(name, apps, models, fields, results)
+        regressions += compare(name, results, baseline.get(name, {}), args.tolerance)
+        baseline[name] = results
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline saved to {args.baseline}")
+    elif regressions:
+        print("\nRegressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
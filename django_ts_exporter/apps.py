@@ -0,0 +1,35 @@
+import threading
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.management import call_command
+from django.utils.autoreload import autoreload_started
+
+
+def export_on_reload(sender, **kwargs):
+    from .management.commands.export_ts import Command
+
+    # runserver restarts its process after every code change, so this runs once
+    # per reload, with the app registry of the server already populated.
+    args = ["--incremental"] + list(settings.TS_EXPORTER_RUNSERVER_ARGS)
+
+    def export():
+        try:
+            call_command(Command(), *args)
+        except Exception as e:
+            print(f"Error while exporting TypeScript interfaces: {e}")
+
+    # Exporting in a thread keeps the server from waiting for it.
+    thread = threading.Thread(target=export, name="export_ts", daemon=True)
+    thread.start()
+    return thread
+
+
+class DjangoTsExporterConfig(AppConfig):
+    name = "django_ts_exporter"
+    verbose_name = "Django TS Exporter"
+
+    def ready(self):
+        if getattr(settings, "TS_EXPORTER_RUNSERVER_ARGS", None) is not None:
+            autoreload_started.connect(
+                export_on_reload, dispatch_uid="django_ts_exporter.export_on_reload"
+            )
@@ -0,0 +1,379 @@
+import os
+import sys
+import functools
+import multiprocessing
+from django.apps import apps
+from .bundler import Bundler
+from .diagnostics import Diagnostics, MemoryDiagnostics, NullDiagnostics
+from .emitter import RenderedInterface, TypeScriptEmitter
+from .enums import SHARED_ENUMS_LABEL, EnumRegistry
+from .graph import DependencyGraph, Selection
+from .index import TypeIndex
+from .profiling import NullProfiler
+from .schema import Reference
+from .sinks import FileSystemSink
+
+# Name of Reference before the schema existed, kept for custom field handlers.
+Import = Reference
+
+# Exporter inherited by forked workers, so they start with Django already set up.
+_worker_exporter = None
+
+
+def _render_app_in_worker(app):
+    _worker_exporter.diagnostics = MemoryDiagnostics()
+    _worker_exporter.profiler.clear()
+    interfaces = list(_worker_exporter.profile_render_app(app))
+    return (
+        interfaces,
+        _worker_exporter.diagnostics.close(),
+        _worker_exporter.diagnostics.cycles,
+        _worker_exporter.profiler.snapshot(),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def real_path(path):
+    # realpath stats every directory of the path, and classes share a few
+    # modules.
+    return os.path.realpath(path)
+
+
+def source_file(cls):
+    path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+    return real_path(path) if path else None
+
+
+class BaseExporter:
+    source = None
+
+    def __init__(
+        self,
+        outdir,
+        apps,
+        enable_logs,
+        incremental=False,
+        jobs=1,
+        bundle=None,
+        sink=None,
+        profiler=None,
+        only=None,
+        changed_files=None,
+        shared_enums=False,
+        declarations=False,
+        enum_style=None,
+        compact_choices=None,
+        choice_labels=False,
+        diagnostics=None,
+        index=None,
+    ):
+        self.outdir = outdir
+        self.apps = apps
+        self.enable_logs = enable_logs
+        self.incremental = incremental
+        self.jobs = jobs
+        self.sink = sink or FileSystemSink(outdir, incremental)
+        self.emitter = TypeScriptEmitter(
+            enum_style, declarations, compact_choices, choice_labels
+        )
+        self.bundler = Bundler(bundle, self.emitter) if bundle else None
+        self.shared_enums = shared_enums
+        self.profiler = profiler or NullProfiler()
+        self.only = only or []
+        self.changed_files = changed_files or []
+        self.graph = DependencyGraph(self.source)
+        self.selection = None
+        # Nodes of the previous export, before a partial run replaces some.
+        self.previous_nodes = None
+        # May be shared with the other exporter of the same run.
+        self.index = index
+        self.rendered = {}
+        if diagnostics is None:
+            diagnostics = Diagnostics() if enable_logs else NullDiagnostics()
+        self.diagnostics = diagnostics
+
+    def export(self):
+        self.type_index()
+        if self.partial:
+            self.select()
+
+        # Interfaces are written one at a time, as they are built, unless the
+        # output depends on all of them.
+        for app, interfaces in self.render_apps():
+            if self.collects:
+                self.rendered[app] = list(interfaces)
+            else:
+                self.write_interfaces(interfaces)
+
+        if self.collects:
+            self.write_rendered()
+
+        with self.profiler.phase("write"):
+            result = self.sink.close()
+            self.save_graph()
+        if self.manifest and self.enable_logs:
+            self.log_manifest()
+
+        self.diagnostics.close()
+
+        return result
+
+    @property
+    def manifest(self):
+        return getattr(self.sink, "manifest", None)
+
+    @property
+    def partial(self):
+        return bool(self.only or self.changed_files)
+
+    @property
+    def collects(self):
+        # Bundles and shared enums depend on every app, so the schema of all of
+        # them is kept and written at the end.
+        return bool(self.bundler or self.shared_enums)
+
+    def type_index(self):
+        # Built on first use, from every app of the run, before anything is
+        # rendered or selected.
+        if self.index is None:
+            with self.profiler.phase("discovery"):
+                self.index = self.build_index()
+        self.emitter.output_dirs = self.index.output_dirs
+        return self.index
+
+    def build_index(self):
+        index = TypeIndex()
+        for app in self.apps:
+            index.add_app(self.get_app_config(app))
+        return index
+
+    def select(self):
+        previous = DependencyGraph.load(self.outdir, self.source)
+        if previous is None:
+            print(
+                "No dependency graph in the output directory; exporting everything. "
+                "It is written by incremental exports."
+            )
+            return
+
+        self.previous_nodes = dict(previous.nodes)
+        selected = previous.select(self.only, self.changed_files)
+        self.selection = Selection(previous, selected, self.changed_files)
+        self.graph = previous
+        self.graph.remove(selected)
+        if self.manifest:
+            # Only files of the selected nodes may be pruned; everything else
+            # is not regenerated by a partial run.
+            self.manifest.retain(set(self.manifest.entries) - self.selection.files)
+
+    @property
+    def keeps_graph(self):
+        # The graph maps classes to per-class files in the output directory.
+        # It only serves incremental runs, so other exports neither build nor
+        # write it.
+        return (
+            isinstance(self.sink, FileSystemSink)
+            and not self.bundler
+            and (self.incremental or self.partial)
+        )
+
+    def graph_sources(self, *classes):
+        # Files the classes are defined in, which only the graph records.
+        if not self.keeps_graph:
+            return ()
+        return tuple(source_file(cls) for cls in classes)
+
+    def save_graph(self):
+        if self.keeps_graph:
+            self.graph.save(self.outdir)
+
+    def selected_apps(self):
+        if self.selection is None:
+            return self.apps
+        return [
+            app
+            for app in self.apps
+            if self.selection.includes_app(self.get_app_config(app))
+        ]
+
+    def is_selected(self, app_config, name, cls):
+        return self.selection is None or self.selection.includes(
+            app_config.label, name, source_file(cls)
+        )
+
+    def render_apps(self):
+        apps = self.selected_apps()
+        if self.jobs > 1 and len(apps) > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                yield from self.render_apps_in_parallel(apps)
+                return
+            print(
+                "Parallel export requires the 'fork' start method; exporting serially."
+            )
+
+        for app in apps:
+            yield app, self.profile_render_app(app)
+
+    def render_apps_in_parallel(self, apps):
+        global _worker_exporter
+
+        _worker_exporter = self
+        try:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(min(self.jobs, len(apps))) as pool:
+                # imap keeps the order of the apps, so results are merged
+                # exactly as a serial run would produce them.
+                results = pool.imap(_render_app_in_worker, apps)
+                for app, (interfaces, any_fields, cycles, profile) in zip(
+                    apps, results
+                ):
+                    for label in any_fields:
+                        self.diagnostics.any_field(label)
+                    for path in cycles:
+                        self.diagnostics.cycle(path)
+                    self.profiler.merge(profile)
+                    yield app, interfaces
+        finally:
+            _worker_exporter = None
+
+    def export_app(self, app):
+        self.write_interfaces(self.iter_app(app))
+
+    def iter_app(self, app):
+        # Yields the interfaces of the app one at a time.
+        raise NotImplementedError
+
+    def render_app(self, app):
+        return list(self.iter_app(app))
+
+    def profile_render_app(self, app):
+        # Only building the interfaces counts as rendering the app, not what
+        # the consumer does with each one before asking for the next.
+        interfaces = self.iter_app(app)
+        while True:
+            with self.profiler.app(app), self.profiler.phase("render"):
+                interface = next(interfaces, None)
+            if interface is None:
+                return
+            yield interface
+
+    def refresh_app(self, app):
+        # Reloaded modules define new classes.
+        self.index = None
+        self.type_index()
+
+        if self.collects:
+            # Everything is written again from the kept schema; the manifest
+            # skips files whose content did not change.
+            if self.manifest:
+                self.manifest.forget("")
+            self.graph = DependencyGraph(self.source)
+            self.rendered[app] = self.render_app(app)
+            self.write_rendered()
+            if self.manifest:
+                self.manifest.prune()
+                self.manifest.save()
+            self.save_graph()
+            return
+
+        app_name = self.get_app_config(app).name
+        app_prefix = f"{app_name}/"
+        if self.manifest:
+            self.manifest.forget(app_prefix)
+        self.graph.remove(
+            [key for key, node in self.graph.nodes.items() if node["app"] == app_name]
+        )
+        self.export_app(app)
+        if self.manifest:
+            self.manifest.prune(app_prefix)
+            self.manifest.save()
+        self.save_graph()
+
+    def get_app_config(self, app):
+        for app_config in apps.get_app_configs():
+            if app_config.name == app:
+                return app_config
+        return apps.get_app_config(app.split(".")[-1])
+
+    def write_interfaces(self, interfaces):
+        for interface in interfaces:
+            with self.profiler.phase("emit"):
+                rendered = self.emitter.render(interface)
+                import_statements = self.emitter.imports(
+                    rendered.imports, rendered.app_name
+                )
+            ts_interface = rendered.body
+            if import_statements:
+                ts_interface = f"{import_statements}\n\n{ts_interface}"
+
+            app_outdir = os.path.join(self.outdir, interface.app_name)
+            self.write_interface(
+                app_outdir, interface.name, ts_interface, rendered.imports
+            )
+            if self.keeps_graph:
+                self.graph.add(
+                    interface,
+                    f"{interface.app_name}/{interface.name}{self.emitter.extension}",
+                )
+
+    def write_rendered(self):
+        interfaces = [
+            interface for app in self.apps for interface in self.rendered.get(app, [])
+        ]
+        enums = []
+        if self.shared_enums:
+            with self.profiler.phase("enums"):
+                registry = EnumRegistry(interfaces)
+                interfaces = [registry.share(interface) for interface in interfaces]
+                enums = registry.enums
+
+        if self.bundler:
+            self.write_bundles(interfaces, enums)
+        else:
+            self.write_interfaces(interfaces)
+            self.write_enums(enums)
+
+    def write_enums(self, enums):
+        for enum in enums:
+            with self.profiler.phase("emit"):
+                content = self.emitter.enum(enum)
+            self.write_output(
+                f"{SHARED_ENUMS_LABEL}/{enum.name}{self.emitter.extension}", content
+            )
+
+    def write_bundles(self, interfaces, enums=()):
+        with self.profiler.phase("emit"):
+            rendered = [self.emitter.render(interface) for interface in interfaces]
+            rendered += [
+                RenderedInterface(
+                    SHARED_ENUMS_LABEL,
+                    SHARED_ENUMS_LABEL,
+                    enum.name,
+                    self.emitter.enum(enum),
+                    [],
+                )
+                for enum in enums
+            ]
+        with self.profiler.phase("bundle"):
+            bundles = list(self.bundler.render(rendered))
+        for relpath, content in bundles:
+            self.write_output(relpath, content)
+
+    def write_interface(self, app_outdir, name, ts_interface, imports):
+        interface_path = os.path.join(app_outdir, f"{name}{self.emitter.extension}")
+        self.write_output(os.path.relpath(interface_path, self.outdir), ts_interface)
+
+    def write_output(self, relpath, content):
+        relpath = relpath.replace(os.sep, "/")
+        self.profiler.add_file(relpath, content)
+        with self.profiler.phase("write"):
+            self.sink.write(relpath, content)
+
+    def log_manifest(self):
+        print(
+            f"\nIncremental export: {len(self.manifest.written)} written, "
+            f"{len(self.manifest.skipped)} unchanged, "
+            f"{len(self.manifest.removed)} removed."
+        )
+        for relpath in self.manifest.removed:
+            print(f"Removed {relpath}")
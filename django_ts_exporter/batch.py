@@ -0,0 +1,161 @@
+import os
+import sys
+import json
+import time
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# A project of a batch: the directory to run in, its settings module (or None
+# to read it from manage.py), where to write and extra command line options.
+BatchProject = namedtuple(
+    "BatchProject", ["name", "root", "settings", "outdir", "args"]
+)
+BatchResult = namedtuple("BatchResult", ["project", "returncode", "output", "seconds"])
+
+# Exit status of an export run with --check that found changes.
+OUT_OF_DATE = 1
+
+
+def load_batch(path):
+    """Projects listed in a batch config file.
+
+    The file holds a list of projects, or {"projects": [...]}, each with an
+    "outdir" and a "root" and/or "settings". Paths are relative to the file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("projects")
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"{path} does not list any project.")
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    projects = []
+    for number, entry in enumerate(data, 1):
+        if not isinstance(entry, dict) or not entry.get("outdir"):
+            raise ValueError(f"Project {number} of {path} has no outdir.")
+        if not entry.get("root") and not entry.get("settings"):
+            raise ValueError(f"Project {number} of {path} has no root or settings.")
+        args = entry.get("args", [])
+        if not isinstance(args, list):
+            raise ValueError(f"The args of project {number} of {path} are not a list.")
+
+        root = os.path.normpath(os.path.join(base_dir, entry.get("root", "")))
+        projects.append(
+            BatchProject(
+                entry.get("name") or entry.get("settings") or os.path.basename(root),
+                root,
+                entry.get("settings"),
+                os.path.normpath(os.path.join(base_dir, entry["outdir"])),
+                [str(arg) for arg in args],
+            )
+        )
+    return projects
+
+
+def forwarded_arguments(argv, cwd=None):
+    # Options of the batch invocation that apply to every project. Projects
+    # run from their own root, so the paths of --changed-files, given relative
+    # to where the batch runs, are made absolute.
+    cwd = cwd or os.getcwd()
+    forwarded = []
+    skip = False
+    paths = False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        if arg == "--batch":
+            skip = True
+            continue
+        if arg.startswith("--batch="):
+            continue
+
+        if arg.startswith("-"):
+            paths = arg == "--changed-files"
+            if arg.startswith("--changed-files="):
+                arg = "--changed-files=" + os.path.join(cwd, arg.partition("=")[2])
+        elif paths:
+            arg = os.path.join(cwd, arg)
+        forwarded.append(arg)
+    return forwarded
+
+
+def project_command(project, forwarded):
+    command = [sys.executable, "-m", "django_ts_exporter.exporter"]
+    command += forwarded + project.args
+    # Subprocesses cannot answer the overwrite prompt.
+    command += ["--outdir", project.outdir, "--yes"]
+    if project.settings:
+        command += ["--settings", project.settings]
+    return command
+
+
+def project_environment():
+    env = dict(os.environ)
+    # Each project reads its own settings, never the ones of the batch.
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    # Subprocesses run this copy of the exporter, wherever they start.
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [package_parent, env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def run_project(project, forwarded):
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            project_command(project, forwarded),
+            cwd=project.root,
+            env=project_environment(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+        returncode, output = completed.returncode, completed.stdout
+    except OSError as e:
+        returncode, output = -1, f"{e}\n"
+    return BatchResult(project, returncode, output, time.perf_counter() - started)
+
+
+def run_batch(projects, forwarded, workers=None):
+    # Projects are exported by separate interpreters, so nothing of one
+    # Django setup leaks into another; threads only wait for them.
+    workers = workers or min(len(projects), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda project: run_project(project, forwarded), projects))
+
+
+def status(result):
+    if result.returncode == 0:
+        return "ok"
+    if result.returncode == OUT_OF_DATE:
+        return "out of date"
+    return f"failed ({result.returncode})"
+
+
+def print_summary(results, seconds, stream=None):
+    stream = stream or sys.stdout
+    for result in results:
+        if result.output.strip():
+            stream.write(f"== {result.project.name} ==\n{result.output.rstrip()}\n\n")
+
+    width = max(len(result.project.name) for result in results)
+    stream.write(f"Batch of {len(results)} project(s) done in {seconds:.2f}s:\n")
+    for result in results:
+        stream.write(
+            f"  {result.project.name:<{width}}  {status(result):<12} "
+            f"{result.seconds:6.2f}s  {result.project.outdir}\n"
+        )
+
+
+def batch_exit_status(results):
+    # Failures win over drift, which wins over success.
+    codes = {result.returncode for result in results}
+    if codes - {0, OUT_OF_DATE}:
+        return 2
+    return OUT_OF_DATE if OUT_OF_DATE in codes else 0
@@ -0,0 +1,54 @@
+from .emitter import TypeScriptEmitter
+
+BUNDLE_MODES = ("app", "single")
+SINGLE_BUNDLE_NAME = "index"
+
+
+class Bundler:
+    def __init__(self, mode, emitter=None):
+        if mode not in BUNDLE_MODES:
+            raise ValueError(f"Unknown bundle mode: {mode}")
+        self.mode = mode
+        self.emitter = emitter or TypeScriptEmitter()
+
+    def bundle_name(self, app_label):
+        return app_label if self.mode == "app" else SINGLE_BUNDLE_NAME
+
+    def group(self, interfaces):
+        bundles = {}
+        for interface in interfaces:
+            members = bundles.setdefault(self.bundle_name(interface.app_label), {})
+            existing = members.get(interface.name)
+            if existing and existing.app_label != interface.app_label:
+                raise RuntimeError(
+                    f"Cannot bundle {interface.app_label}.{interface.name}: "
+                    f"{existing.app_label}.{existing.name} has the same name. "
+                    "Use --bundle app instead."
+                )
+            members[interface.name] = interface
+        return bundles
+
+    def render(self, interfaces):
+        for bundle_name, members in self.group(interfaces).items():
+            yield (
+                f"{bundle_name}{self.emitter.extension}",
+                self.render_bundle(bundle_name, members.values()),
+            )
+
+    def render_bundle(self, bundle_name, members):
+        imports = {}
+        for interface in members:
+            for imported in interface.imports:
+                target = self.bundle_name(imported.app_label)
+                if target != bundle_name:
+                    imports.setdefault(target, set()).add(imported.name)
+
+        import_statements = "\n".join(
+            self.emitter.import_statement(sorted(names), f"./{target}")
+            for target, names in sorted(imports.items())
+        )
+        body = "".join(interface.body for interface in members)
+
+        if import_statements:
+            return f"{import_statements}\n\n{body}"
+        return body
@@ -0,0 +1,60 @@
+import sys
+
+
+def cycle_message(path):
+    return f"Cyclic serializer reference typed 'any': {' -> '.join(path)}\n"
+
+
+class NullDiagnostics:
+    def any_field(self, label):
+        pass
+
+    def cycle(self, path):
+        # Cycles silently turn fields into 'any', so they are reported without
+        # logs too, on stderr to keep --stdout output valid.
+        sys.stderr.write(cycle_message(path))
+
+    def close(self):
+        pass
+
+
+class Diagnostics:
+    """Prints fields typed 'any' as they are found, instead of keeping them."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, text):
+        (self.stream or sys.stdout).write(text)
+
+    def any_field(self, label):
+        if not self.count:
+            self.write("\nFields with 'any' type detected:\n")
+        self.count += 1
+        self.write(f"{label}\n")
+
+    def cycle(self, path):
+        self.write(cycle_message(path))
+
+    def close(self):
+        if not self.count:
+            self.write("\nNo fields with 'any' type detected.\n")
+        # Watch mode reports every refresh on its own.
+        self.count = 0
+
+
+class MemoryDiagnostics:
+    # Keeps the labels, e.g. for parallel workers to send them to the parent.
+    def __init__(self):
+        self.any_fields = []
+        self.cycles = []
+
+    def any_field(self, label):
+        self.any_fields.append(label)
+
+    def cycle(self, path):
+        self.cycles.append(path)
+
+    def close(self):
+        return self.any_fields
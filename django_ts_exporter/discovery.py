@@ -0,0 +1,148 @@
+import os
+import ast
+import builtins
+
+# Bases from these packages never make a class exportable by themselves.
+STDLIB_PACKAGES = ("abc", "collections", "dataclasses", "enum", "typing")
+
+
+def dotted_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = dotted_name(node.value)
+        return f"{parent}.{node.attr}" if parent else None
+    if isinstance(node, ast.Subscript):  # Generic[T], Base[Model]
+        return dotted_name(node.value)
+    return None
+
+
+# Functions creating classes the scan cannot see: type(name, bases, dict),
+# exec() and assignments through globals() or setattr().
+RUNTIME_CLASS_FACTORIES = ("type", "exec", "globals", "setattr")
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def module_statements(body):
+    """Yield the statements run when the module is imported.
+
+    Blocks of if, try/except/else/finally, with, for and while statements are
+    included; bodies of functions and classes are not.
+    """
+    for node in body:
+        yield node
+        if isinstance(node, DEFINITIONS):
+            continue
+        for _, value in ast.iter_fields(node):
+            if not isinstance(value, list):
+                continue
+            for item in value:
+                if isinstance(item, ast.stmt):
+                    yield from module_statements([item])
+                elif isinstance(getattr(item, "body", None), list):
+                    # except handlers and match cases
+                    yield from module_statements(item.body)
+
+
+def is_simple_statement(node):
+    # Statements of compound ones are yielded on their own.
+    return not hasattr(node, "body") and not hasattr(node, "cases")
+
+
+def creates_classes_at_runtime(node):
+    for child in ast.walk(node):
+        if (
+            isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Name)
+            and child.func.id in RUNTIME_CLASS_FACTORIES
+            and (child.func.id != "type" or len(child.args) == 3)
+        ):
+            return True
+    return False
+
+
+class ModuleScanner:
+    def __init__(self, base_suffix, known_packages=()):
+        self.base_suffix = base_suffix
+        self.known_packages = STDLIB_PACKAGES + tuple(known_packages)
+        self.cache = {}
+        self.scans = 0
+
+    def needs_import(self, path):
+        if not path or not path.endswith(".py"):
+            return True
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return True
+
+        cached = self.cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+            result = self.defines_exportable_classes(tree)
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            # Let the real import report the problem.
+            result = True
+        self.scans += 1
+        self.cache[path] = (mtime_ns, result)
+        return result
+
+    def defines_exportable_classes(self, tree):
+        imports = {}
+        local_classes = {}
+
+        for node in module_statements(tree.body):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        imports[alias.asname] = alias.name
+                    else:
+                        root = alias.name.split(".")[0]
+                        imports[root] = root
+            elif isinstance(node, ast.ImportFrom):
+                module = "." * node.level + (node.module or "")
+                for alias in node.names:
+                    imports[alias.asname or alias.name] = f"{module}.{alias.name}"
+            elif isinstance(node, ast.ClassDef):
+                exportable = self.is_exportable(node, imports, local_classes)
+                local_classes[node.name] = exportable
+                if exportable:
+                    return True
+            elif is_simple_statement(node) and creates_classes_at_runtime(node):
+                return True  # Let the real import find them.
+        return False
+
+    def is_exportable(self, node, imports, local_classes):
+        for base in node.bases:
+            name = dotted_name(base)
+            if name is None:
+                return True  # Cannot be resolved statically.
+
+            root, _, rest = name.partition(".")
+            if not rest and root in local_classes:
+                if local_classes[root]:
+                    return True
+                continue
+
+            origin = imports.get(root)
+            resolved = f"{origin}.{rest}" if origin and rest else origin or name
+            if resolved.split(".")[-1].endswith(self.base_suffix):
+                return True
+
+            if origin is None:
+                if hasattr(builtins, root):
+                    continue
+                return True  # Defined by star imports or at runtime.
+
+            if origin.split(".")[0] in self.known_packages:
+                continue
+            return True
+        return False
+
+
+# Classes from Django or DRF are only serializers when their name says so.
+serializer_scanner = ModuleScanner("Serializer", ("django", "rest_framework"))
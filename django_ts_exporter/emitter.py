@@ -0,0 +1,140 @@
+from collections import namedtuple
+from .schema import Array, Enum, InlineObject, Raw, Reference
+
+RenderedInterface = namedtuple(
+    "RenderedInterface", ["app_name", "app_label", "name", "body", "imports"]
+)
+
+# enum: a regular enum, with a runtime object; const: a const enum, inlined by
+# tsc; union: a union of the values; values: an "as const" array of the values
+# and a union type derived from it, cheap to type-check for large choices.
+ENUM_STYLES = ("enum", "const", "union", "values")
+
+
+def string_literal(value):
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+class TypeScriptEmitter:
+    def __init__(
+        self,
+        enum_style=None,
+        declarations=False,
+        compact_choices=None,
+        choice_labels=False,
+    ):
+        # Declaration files have no runtime code, so regular enums are
+        # written as const enums there.
+        enum_style = enum_style or ("const" if declarations else "enum")
+        if enum_style not in ENUM_STYLES:
+            raise ValueError(f"Unknown enum style: {enum_style}")
+        if declarations and enum_style == "enum":
+            raise ValueError("Declaration files cannot contain regular enums.")
+        self.enum_style = enum_style
+        self.declarations = declarations
+        self.extension = ".d.ts" if declarations else ".ts"
+        # Enums with more members than this are written in the values style.
+        self.compact_choices = compact_choices
+        # Whether the values style also exports a map from values to labels.
+        self.choice_labels = choice_labels
+        # App label -> directory of its files, when they differ (see TypeIndex).
+        self.output_dirs = {}
+
+    def type(self, ts_type):
+        if isinstance(ts_type, str):
+            return ts_type
+        if isinstance(ts_type, (Reference, Enum)):
+            return ts_type.name
+        if isinstance(ts_type, Array):
+            return f"{self.type(ts_type.item)}[]"
+        if isinstance(ts_type, InlineObject):
+            return "{ " + " ".join(self.field(f) for f in ts_type.fields) + " }"
+        if isinstance(ts_type, Raw):
+            return ts_type.ts_type
+        raise TypeError(f"Unknown type node: {ts_type!r}")
+
+    def field(self, field):
+        return f"{field.name}: {self.type(field.type)};"
+
+    def enum_style_for(self, enum):
+        if (
+            self.compact_choices is not None
+            and len(enum.members) > self.compact_choices
+        ):
+            return "values"
+        return self.enum_style
+
+    def enum(self, enum):
+        enum_style = self.enum_style_for(enum)
+        if enum_style == "values":
+            return self.values_enum(enum)
+        if enum_style == "union":
+            values = " | ".join(string_literal(value) for _, value in enum.members)
+            return f"export type {enum.name} = {values or 'never'};\n"
+
+        keyword = "const enum" if enum_style == "const" else "enum"
+        lines = [f"export {keyword} {enum.name} {{"]
+        lines += [f"  {key} = {string_literal(value)}," for key, value in enum.members]
+        return "\n".join(lines) + "\n}\n"
+
+    def values_enum(self, enum):
+        values_name = f"{enum.name}Values"
+        values = [string_literal(value) for _, value in enum.members]
+        if self.declarations:
+            lines = [
+                f"export declare const {values_name}: readonly [{', '.join(values)}];"
+            ]
+        else:
+            lines = [f"export const {values_name} = ["]
+            lines += [f"  {value}," for value in values]
+            lines.append("] as const;")
+        lines.append(f"export type {enum.name} = (typeof {values_name})[number];")
+
+        if self.choice_labels and enum.labels:
+            labels_type = f"Record<{enum.name}, string>"
+            if self.declarations:
+                lines.append(f"export declare const {enum.name}Labels: {labels_type};")
+            else:
+                lines.append(f"export const {enum.name}Labels: {labels_type} = {{")
+                lines += [
+                    f"  {value}: {string_literal(label)},"
+                    for value, label in zip(values, enum.labels)
+                ]
+                lines.append("};")
+        return "\n".join(lines) + "\n"
+
+    def interface(self, interface):
+        enum_statements = "\n".join(sorted(self.enum(e) for e in interface.enums))
+        fields = "\n  ".join(self.field(field) for field in interface.fields)
+        body = f"export interface {interface.name} {{\n  {fields}\n}}\n\n"
+        if enum_statements:
+            return f"{enum_statements}\n\n{body}"
+        return body
+
+    def import_statement(self, names, module_path):
+        # Declarations only import types, from paths without extension, which
+        # resolve to the .d.ts files.
+        if self.declarations:
+            return f'import type {{ {", ".join(names)} }} from "{module_path}";'
+        return f'import {{ {", ".join(names)} }} from "{module_path}{self.extension}";'
+
+    def imports(self, references, app_name):
+        statements = []
+        for reference in references:
+            output_dir = self.output_dirs.get(reference.app_label, reference.app_label)
+            if output_dir == app_name:
+                module_path = f"./{reference.name}"
+            else:
+                module_path = f"../{output_dir}/{reference.name}"
+            statements.append(self.import_statement([reference.name], module_path))
+        return "\n".join(sorted(statements))
+
+    def render(self, interface):
+        return RenderedInterface(
+            interface.app_name,
+            interface.app_label,
+            interface.name,
+            self.interface(interface),
+            interface.references,
+        )
@@ -0,0 +1,110 @@
+from django.db import models
+from .schema import Enum, Reference
+
+# Shared enums are written like the interfaces of an app with this label.
+SHARED_ENUMS_LABEL = "enums"
+
+
+def identifier(label):
+    # A valid TypeScript identifier, for labels like "In review" or "1-2 days".
+    name = str(label).replace(" ", "_").replace("�", "í")
+    name = "".join(c if f"_{c}".isidentifier() else "_" for c in name)
+    if not name[:1].isidentifier():
+        name = f"_{name}"
+    return name
+
+
+def enum_members(choices):
+    members = []
+    keys = set()
+    for value, label in choices:
+        key = base = identifier(label)
+        suffix = 2
+        while key in keys:
+            key = f"{base}{suffix}"
+            suffix += 1
+        keys.add(key)
+        members.append((key, value))
+    return tuple(members)
+
+
+def choices_enum(name, choices):
+    choices = list(choices)
+    return Enum(name, enum_members(choices), tuple(str(label) for _, label in choices))
+
+
+def enum_content(enum):
+    # Identifies an enum regardless of its name.
+    return (enum.members, enum.labels)
+
+
+def choices_class_names():
+    # TextChoices/IntegerChoices classes by content, to name shared enums after
+    # the class the choices come from.
+    names = {}
+    pending = list(models.Choices.__subclasses__())
+    while pending:
+        choices_class = pending.pop()
+        pending += choices_class.__subclasses__()
+        if choices_class.choices:
+            enum = choices_enum(None, choices_class.choices)
+            names.setdefault(enum_content(enum), set()).add(choices_class.__name__)
+    return names
+
+
+class EnumRegistry:
+    def __init__(self, interfaces):
+        # Enum names of every field using the same choices, by members and
+        # labels.
+        self.sites = {}
+        for interface in interfaces:
+            if interface.app_label == SHARED_ENUMS_LABEL:
+                raise RuntimeError(
+                    f"Cannot share enums: the app {interface.app_name} uses the "
+                    f"'{SHARED_ENUMS_LABEL}' label of the shared enums module."
+                )
+            for enum in interface.enums:
+                self.sites.setdefault(enum_content(enum), set()).add(enum.name)
+        self.names = self.assign_names()
+
+    def assign_names(self):
+        class_names = choices_class_names()
+        candidates = {}
+        for content, site_names in self.sites.items():
+            owners = class_names.get(content, ())
+            if len(owners) == 1:
+                (owner,) = owners
+                name = owner if owner.endswith("Enum") else f"{owner}Enum"
+            else:
+                name = min(site_names)
+            candidates.setdefault(name, []).append(content)
+
+        # Names are picked from the whole project, so they do not depend on
+        # the order in which apps were rendered.
+        # Suffixes skip every name already taken, including candidates that
+        # are literally named like a suffixed one (StatusEnum2).
+        names = {}
+        taken = set(candidates)
+        for name, contents in sorted(candidates.items()):
+            first, *others = sorted(contents, key=repr)
+            names[first] = name
+            suffix = 1
+            for content in others:
+                suffix += 1
+                while f"{name}{suffix}" in taken:
+                    suffix += 1
+                taken.add(f"{name}{suffix}")
+                names[content] = f"{name}{suffix}"
+        return names
+
+    @property
+    def enums(self):
+        return sorted(Enum(name, *content) for content, name in self.names.items())
+
+    def share(self, interface):
+        def replace(ts_type):
+            if isinstance(ts_type, Enum):
+                return Reference(self.names[enum_content(ts_type)], SHARED_ENUMS_LABEL)
+            return ts_type
+
+        return interface.replace_types(replace)
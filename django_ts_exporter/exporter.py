@@ -1,20 +1,90 @@
 import os
 import sys
-import django
+import time
 import argparse
 from pathlib import Path
-from django.apps import apps
-from django.conf import settings
-from .serializers_exporter import SerializersExporter
-from .models_exporter import ModelsExporter
+from . import __version__
+from .bundler import BUNDLE_MODES
+from .emitter import ENUM_STYLES
+from .profiling import NullProfiler, Profiler
+from .sinks import ArchiveSink, CheckSink, StdoutSink, SubtreeSink
+from .stamp import Stamp
+from .watcher import Watcher
+
+# Django and the exporters are imported where they are used, so that
+# --skip-unchanged can check the stamp without paying for their imports.
+
+SOURCES = ("serializers", "models", "all")
 
 
 class TypeScriptExporter:
-    def __init__(self, outdir, exclude, enable_logs, source):
+    def __init__(
+        self,
+        outdir,
+        exclude,
+        enable_logs,
+        source,
+        incremental=False,
+        watch=False,
+        interval=0.5,
+        jobs=1,
+        bundle=None,
+        include=None,
+        stdout=False,
+        archive=None,
+        profile=None,
+        profile_top=10,
+        profile_dump=None,
+        only=None,
+        changed_files=None,
+        shared_enums=False,
+        reachable_only=False,
+        skip_unchanged=False,
+        declarations=False,
+        enum_style=None,
+        compact_choices=None,
+        choice_labels=False,
+        check=False,
+        settings=None,
+        yes=False,
+    ):
         self.outdir = outdir
         self.exclude = exclude
         self.enable_logs = enable_logs
         self.source = source
+        self.only = only or []
+        self.changed_files = changed_files or []
+        self.shared_enums = shared_enums
+        self.reachable_only = reachable_only
+        self.skip_unchanged = skip_unchanged
+        self.declarations = declarations
+        self.enum_style = enum_style
+        self.compact_choices = compact_choices
+        self.choice_labels = choice_labels
+        self.check = check
+        # Settings module to use instead of the one named in manage.py.
+        self.settings = settings
+        # Overwrite an existing output directory without asking.
+        self.yes = yes
+        # Watch mode and partial exports regenerate part of the output, which
+        # relies on the manifest to leave untouched files alone and to prune
+        # removed classes.
+        self.incremental = incremental or watch or bool(self.only or self.changed_files)
+        self.watch = watch
+        self.interval = interval
+        self.jobs = jobs
+        self.bundle = bundle
+        self.include = include or []
+        self.stdout = stdout
+        self.archive = archive
+        # profile is the path of the JSON report, or "" for the console only.
+        self.profile = profile
+        self.profile_top = profile_top
+        self.profile_dump = profile_dump
+
+    @property
+    def profiling(self):
+        return self.profile is not None or bool(self.profile_dump)
 
     def find_django_settings_module(self):
         current_dir = os.getcwd()
@@ -38,6 +108,8 @@ class TypeScriptExporter:
         )
 
     def get_local_apps(self):
+        from django.conf import settings
+
         local_apps = []
         installed_apps = settings.INSTALLED_APPS
         base_dir = settings.BASE_DIR
@@ -49,34 +121,108 @@ class TypeScriptExporter:
         return local_apps
 
     def find_project_root(self):
-        current_dir = Path(__file__).resolve().parent
-        while current_dir != current_dir.root:
-            if (current_dir / "manage.py").exists():
-                return current_dir
-            current_dir = current_dir.parent
+        current_dir = Path.cwd().resolve()
+        for directory in [current_dir] + list(current_dir.parents):
+            if (directory / "manage.py").exists():
+                return directory
+        if self.settings:
+            # With an explicit settings module, manage.py is optional.
+            return current_dir
         raise RuntimeError(
             "Could not find the project root. Please ensure this script is run within a Django project."
         )
 
+    def start_profiler(self):
+        if not self.profiling:
+            return NullProfiler()
+        profiler = Profiler(self.profile_top, self.profile_dump)
+        profiler.start()
+        return profiler
+
+    def stamp_options(self):
+        # Options that change the generated files.
+        return {
+            "source": self.source,
+            "exclude": sorted(self.exclude),
+            "include": sorted(self.include),
+            "bundle": self.bundle,
+            "only": sorted(self.only),
+            "changed_files": sorted(self.changed_files),
+            "shared_enums": self.shared_enums,
+            "reachable_only": self.reachable_only,
+            "declarations": self.declarations,
+            "enum_style": self.enum_style,
+            "compact_choices": self.compact_choices,
+            "choice_labels": self.choice_labels,
+        }
+
+    def check_stamp(self):
+        # Returns the stamp to save after exporting, or None when nothing
+        # changed since the last export.
+        stamp = Stamp(
+            self.outdir,
+            self.find_project_root(),
+            os.environ.get("DJANGO_SETTINGS_MODULE"),
+            self.stamp_options(),
+        )
+        if stamp.is_current():
+            print(f"Nothing changed since the last export to {self.outdir}.")
+            return None
+        return stamp
+
     def run(self):
-        settings_module = self.find_django_settings_module()
         project_root = self.find_project_root()
         sys.path.append(str(project_root))
-        os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+        if self.settings:
+            os.environ["DJANGO_SETTINGS_MODULE"] = self.settings
+        else:
+            settings_module = self.find_django_settings_module()
+            os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+        stamp = None
+        if self.skip_unchanged:
+            stamp = self.check_stamp()
+            if stamp is None:
+                return
+
+        import django
 
+        profiler = self.start_profiler()
         try:
-            django.setup()
+            with profiler.phase("django.setup"):
+                django.setup()
         except Exception as e:
             print(f"Error during django.setup(): {e}")
             raise
 
+        return self.export(profiler, stamp)
+
+    def export(self, profiler=None, stamp=None):
+        # Entry point for processes where Django is already set up, e.g. the
+        # export_ts management command. Returns 1 when --check finds changes.
+        if self.skip_unchanged and stamp is None:
+            stamp = self.check_stamp()
+            if stamp is None:
+                return
+
+        if profiler is None:
+            profiler = self.start_profiler()
+
         local_apps = self.get_local_apps()
+        local_apps += [app for app in self.include if app not in local_apps]
         if self.enable_logs:
             print(f"Local apps: {local_apps}")
 
-        if not os.path.exists(self.outdir):
+        sink = None
+        if self.check:
+            sink = CheckSink(self.outdir)
+        elif self.stdout:
+            sink = StdoutSink()
+        elif self.archive:
+            sink = ArchiveSink(self.archive)
+        elif not os.path.exists(self.outdir):
             os.makedirs(self.outdir)
-        else:
+        elif not self.incremental and not self.yes:
             overwrite = (
                 input(
                     f"Directory {self.outdir} already exists. Do you want to overwrite it? (yes/no): "
@@ -90,19 +236,104 @@ class TypeScriptExporter:
                 )
                 return
 
+        exporters = self.create_exporters(local_apps, sink, profiler)
+        results = [exporter.export() for exporter in exporters]
+        result = results[0]
+        if len(exporters) > 1 and sink:
+            result = sink.close()
+        if stamp:
+            stamp.save()
+
+        if self.profiling:
+            # Both subtrees of --source all have a manifest; files are then
+            # counted from the profiler.
+            manifest = exporters[0].manifest if len(exporters) == 1 else None
+            profiler.stop()
+            profiler.print_report(manifest)
+            if self.profile:
+                profiler.write_report(self.profile, manifest)
+
+        if self.watch:
+            Watcher(exporters[0], self.interval, self.enable_logs).run()
+
+        if self.check:
+            return self.report_drift(result)
+
+    def create_exporters(self, local_apps, sink, profiler):
+        from .models_exporter import ModelsExporter
+        from .serializers_exporter import SerializersExporter
+
+        if self.source == "models":
+            return [self.create_exporter(ModelsExporter, local_apps, sink, profiler)]
         if self.source == "serializers":
-            exporter = SerializersExporter(self.outdir, local_apps, self.enable_logs)
-        else:
-            exporter = ModelsExporter(self.outdir, local_apps, self.enable_logs)
+            return [
+                self.create_exporter(
+                    SerializersExporter,
+                    local_apps,
+                    sink,
+                    profiler,
+                    reachable_only=self.reachable_only,
+                )
+            ]
 
-        exporter.export()
+        # --source all writes each source into its own subtree, in one process:
+        # Django, the apps and their modules are loaded once, and the index of
+        # models and serializers is built once and shared.
+        serializers_exporter = self.create_exporter(
+            SerializersExporter,
+            local_apps,
+            SubtreeSink(sink, "serializers") if sink else None,
+            profiler,
+            "serializers",
+            reachable_only=self.reachable_only,
+        )
+        models_exporter = self.create_exporter(
+            ModelsExporter,
+            local_apps,
+            SubtreeSink(sink, "models") if sink else None,
+            profiler,
+            "models",
+            index=serializers_exporter.type_index(),
+        )
+        return [models_exporter, serializers_exporter]
 
+    def create_exporter(
+        self, exporter_class, local_apps, sink, profiler, subtree="", **options
+    ):
+        return exporter_class(
+            os.path.join(self.outdir, subtree) if subtree else self.outdir,
+            local_apps,
+            self.enable_logs,
+            incremental=self.incremental,
+            jobs=self.jobs,
+            bundle=self.bundle,
+            sink=sink,
+            profiler=profiler,
+            only=self.only,
+            changed_files=self.changed_files,
+            shared_enums=self.shared_enums,
+            declarations=self.declarations,
+            enum_style=self.enum_style,
+            compact_choices=self.compact_choices,
+            choice_labels=self.choice_labels,
+            **options,
+        )
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Export Django models and serializers to TypeScript interfaces.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
+    def report_drift(self, drift):
+        # One line per file, marked like git status --short.
+        for mark, relpaths in zip("MAD", drift):
+            for relpath in relpaths:
+                print(f"{mark} {relpath}")
+        count = sum(len(relpaths) for relpaths in drift)
+        if count:
+            print(f"{count} file(s) in {self.outdir} are out of date.")
+            return 1
+        print(f"{self.outdir} is up to date.")
+        return 0
+
+
+def add_arguments(parser):
+    # Shared by the command line tool and the export_ts management command.
     parser.add_argument(
         "-o",
         "--outdir",
@@ -118,6 +349,13 @@ def main():
         default=[],
         help="List of apps to exclude from export.",
     )
+    parser.add_argument(
+        "--include",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Apps outside the project (e.g. django.contrib.auth) to export as well.",
+    )
     parser.add_argument(
         "-l", "--logs", action="store_true", help="Enable detailed logs."
     )
@@ -125,17 +363,299 @@ def main():
         "-s",
         "--source",
         type=str,
-        choices=["serializers", "models"],
+        choices=SOURCES,
         default="serializers",
-        help="Source to export: serializers or models",
+        help="Source to export: serializers, models, or all to export both in one "
+        "run, into the serializers/ and models/ subdirectories of --outdir.",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Only write files whose content changed and remove stale ones, "
+        "tracked by a manifest in the output directory.",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep Django loaded and re-export apps whenever their sources change. "
+        "Implies --incremental.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to export apps in parallel.",
+    )
+    parser.add_argument(
+        "-b",
+        "--bundle",
+        type=str,
+        choices=BUNDLE_MODES,
+        default=None,
+        help="Emit one module per app (app) or one module for the whole project "
+        "(single) instead of one file per class.",
+    )
+    parser.add_argument(
+        "--only",
+        type=str,
+        nargs="+",
+        default=[],
+        metavar="APP.NAME",
+        help="Only regenerate these models or serializers (e.g. shop.Order) and "
+        "the interfaces depending on them. Implies --incremental.",
+    )
+    parser.add_argument(
+        "--changed-files",
+        type=str,
+        nargs="+",
+        default=[],
+        metavar="PATH",
+        help="Only regenerate the interfaces built from these source files and the "
+        "interfaces depending on them. Implies --incremental.",
+    )
+    parser.add_argument(
+        "--shared-enums",
+        action="store_true",
+        help="Write each distinct set of choices once, as an enum in a shared "
+        "'enums' module imported where needed, instead of one enum per field.",
     )
     parser.add_argument(
-        "-v", "--version", action="version", version="django-ts-exporter 0.4.0"
+        "--declarations",
+        action="store_true",
+        help="Write .d.ts declaration files with type-only imports instead of .ts "
+        "modules.",
+    )
+    parser.add_argument(
+        "--enum-style",
+        type=str,
+        choices=ENUM_STYLES,
+        default=None,
+        help="Write choices as regular enums, const enums, unions of their values or "
+        "'as const' arrays of their values with a derived union type. Defaults to "
+        "enum, or const with --declarations.",
+    )
+    parser.add_argument(
+        "--compact-choices",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Write choices with more than N members in the values style, whatever "
+        "the --enum-style.",
+    )
+    parser.add_argument(
+        "--choice-labels",
+        action="store_true",
+        help="Also export a map from values to labels for choices written in the "
+        "values style.",
+    )
+    parser.add_argument(
+        "--reachable-only",
+        action="store_true",
+        help="Only export the serializers used by the DRF views of the URLconf and "
+        "the serializers their interfaces reference.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Compare the generated files with --outdir without writing anything, "
+        "list the files that changed, would be added or removed, and exit with "
+        "status 1 if there are any.",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Exit before setting up Django when no Python file of the project, "
+        "option or generated file changed since the last export.",
+    )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Overwrite an existing output directory without asking.",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Write all generated files to stdout instead of --outdir.",
+    )
+    output.add_argument(
+        "--archive",
+        type=str,
+        default=None,
+        help="Write all generated files into a .tar.gz or .zip archive instead of "
+        "--outdir.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REPORT_JSON",
+        help="Print timings per phase and app, the slowest classes, files written "
+        "and peak memory; optionally also save them as JSON. Adds some overhead.",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Number of slowest models or serializers listed by --profile.",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        type=str,
+        default=None,
+        help="Save cProfile stats of the export to this file (see pstats). "
+        "Implies --profile.",
+    )
+
+
+def validate_arguments(args):
+    partial = args.only or args.changed_files
+    if (args.stdout or args.archive) and (args.incremental or args.watch or partial):
+        return (
+            "--stdout and --archive cannot be combined with --incremental, --watch, "
+            "--only or --changed-files."
+        )
+    if partial and (args.watch or args.bundle or args.shared_enums):
+        return (
+            "--only and --changed-files cannot be combined with --watch, --bundle "
+            "or --shared-enums."
+        )
+    if args.reachable_only and (
+        args.source not in ("serializers", "all") or args.watch or partial
+    ):
+        return (
+            "--reachable-only requires --source serializers or all and cannot be "
+            "combined with --watch, --only or --changed-files."
+        )
+    if args.source == "all" and args.watch:
+        return "--source all cannot be combined with --watch."
+    if args.check and (
+        args.stdout or args.archive or args.watch or partial or args.skip_unchanged
+    ):
+        return (
+            "--check cannot be combined with --stdout, --archive, --watch, --only, "
+            "--changed-files or --skip-unchanged."
+        )
+    if args.declarations and args.enum_style == "enum":
+        return "--declarations requires --enum-style const, union or values."
+    if args.skip_unchanged and (args.stdout or args.archive or args.watch):
+        return (
+            "--skip-unchanged cannot be combined with --stdout, --archive or --watch."
+        )
+    if args.stdout and (args.logs or args.profile is not None or args.profile_dump):
+        return "--stdout cannot be combined with --logs or --profile."
+    return None
+
+
+def exporter_from_arguments(args):
+    return TypeScriptExporter(
+        args.outdir,
+        args.exclude,
+        args.logs,
+        args.source,
+        incremental=args.incremental,
+        watch=args.watch,
+        interval=args.interval,
+        jobs=args.jobs,
+        bundle=args.bundle,
+        include=args.include,
+        stdout=args.stdout,
+        archive=args.archive,
+        profile=args.profile,
+        profile_top=args.profile_top,
+        profile_dump=args.profile_dump,
+        only=args.only,
+        changed_files=args.changed_files,
+        shared_enums=args.shared_enums,
+        reachable_only=args.reachable_only,
+        skip_unchanged=args.skip_unchanged,
+        declarations=args.declarations,
+        enum_style=args.enum_style,
+        compact_choices=args.compact_choices,
+        choice_labels=args.choice_labels,
+        check=args.check,
+        settings=getattr(args, "ts_settings", None),
+        yes=args.yes,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export Django models and serializers to TypeScript interfaces.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    add_arguments(parser)
+    # The management command gets these from Django itself.
+    parser.add_argument(
+        "--settings",
+        dest="ts_settings",
+        type=str,
+        default=None,
+        metavar="SETTINGS_MODULE",
+        help="Django settings module to use instead of the one set in manage.py, "
+        "which is then not needed.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        metavar="CONFIG_JSON",
+        help="Export every project listed in this JSON file in parallel "
+        "subprocesses and print a combined summary. Other options apply to every "
+        "project.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="version", version=f"django-ts-exporter {__version__}"
     )
     args = parser.parse_args()
 
-    exporter = TypeScriptExporter(args.outdir, args.exclude, args.logs, args.source)
-    exporter.run()
+    error = validate_arguments(args) or validate_batch_arguments(args)
+    if error:
+        parser.error(error)
+
+    if args.batch:
+        sys.exit(run_batch(parser, args))
+    sys.exit(exporter_from_arguments(args).run())
+
+
+def validate_batch_arguments(args):
+    if args.batch and (args.stdout or args.archive or args.watch or args.ts_settings):
+        return (
+            "--batch cannot be combined with --stdout, --archive, --watch or "
+            "--settings."
+        )
+    # Every project would write the same file.
+    if args.batch and (args.profile or args.profile_dump):
+        return (
+            "--batch cannot be combined with a --profile report file or --profile-dump."
+        )
+    return None
+
+
+def run_batch(parser, args):
+    from . import batch
+
+    try:
+        projects = batch.load_batch(args.batch)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+    results = batch.run_batch(projects, batch.forwarded_arguments(sys.argv[1:]))
+    batch.print_summary(results, time.perf_counter() - started)
+    return batch.batch_exit_status(results)
 
 
 if __name__ == "__main__":
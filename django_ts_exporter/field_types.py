@@ -0,0 +1,55 @@
+class FieldTypeRegistry:
+    """Maps field classes to TypeScript types.
+
+    A handler is either a TypeScript type string or a callable with the
+    signature ``handler(exporter, field, field_name, app_name, name, original)``
+    returning a type: a TypeScript type string or a node of ``schema`` such
+    as ``Reference``, ``Array`` or ``Enum``. ``(ts_type, extra)`` tuples, where
+    ``extra`` is an ``Import`` or ``None``, are accepted as well. Lookups walk
+    the MRO of the field class once and cache the result, so subclasses of a
+    registered field resolve to the closest registered ancestor.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.cache = {}
+
+    def register(self, field_class, handler):
+        self.handlers[field_class] = handler
+        self.cache.clear()
+
+    def register_default(self, field_class, handler):
+        # Built-in types must not replace a handler a project registered
+        # before the exporter modules were imported.
+        if field_class not in self.handlers:
+            self.register(field_class, handler)
+
+    def unregister(self, field_class):
+        self.handlers.pop(field_class, None)
+        self.cache.clear()
+
+    def lookup(self, field_class):
+        try:
+            return self.cache[field_class]
+        except KeyError:
+            pass
+
+        handler = None
+        for klass in field_class.__mro__:
+            if klass in self.handlers:
+                handler = self.handlers[klass]
+                break
+        self.cache[field_class] = handler
+        return handler
+
+
+model_field_types = FieldTypeRegistry()
+serializer_field_types = FieldTypeRegistry()
+
+
+def register_model_field(field_class, handler):
+    model_field_types.register(field_class, handler)
+
+
+def register_serializer_field(field_class, handler):
+    serializer_field_types.register(field_class, handler)
@@ -0,0 +1,108 @@
+import os
+import json
+from collections import defaultdict
+from .utils import create_directory, write_file
+
+GRAPH_FILENAME = ".ts-exporter-graph.json"
+
+
+def node_id(app_label, name):
+    return f"{app_label}.{name}"
+
+
+class DependencyGraph:
+    def __init__(self, source, nodes=None):
+        self.source = source
+        self.nodes = nodes or {}
+
+    @classmethod
+    def load(cls, outdir, source):
+        try:
+            with open(os.path.join(outdir, GRAPH_FILENAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # A graph written for the other source describes different files.
+        if data.get("source") != source:
+            return None
+        return cls(source, data.get("nodes", {}))
+
+    def save(self, outdir):
+        create_directory(outdir)
+        data = {"source": self.source, "nodes": dict(sorted(self.nodes.items()))}
+        write_file(
+            os.path.join(outdir, GRAPH_FILENAME), json.dumps(data, indent=2) + "\n"
+        )
+
+    def add(self, interface, relpath):
+        self.nodes[node_id(interface.app_label, interface.name)] = {
+            "app": interface.app_name,
+            "file": relpath,
+            "module": interface.module,
+            "models": sorted(set(interface.models)),
+            "sources": sorted({path for path in interface.sources if path}),
+            "imports": sorted(
+                node_id(reference.app_label, reference.name)
+                for reference in interface.references
+            ),
+        }
+
+    def remove(self, node_ids):
+        for removed in node_ids:
+            self.nodes.pop(removed, None)
+
+    def dependents(self):
+        reverse = defaultdict(set)
+        for dependent, node in self.nodes.items():
+            for imported in node["imports"]:
+                reverse[imported].add(dependent)
+        return reverse
+
+    def select(self, only=(), changed_files=()):
+        # Nodes named directly (app.Model or app.Serializer), nodes built from
+        # a named model and nodes whose sources changed, plus everything that
+        # depends on them.
+        only = set(only)
+        changed_files = {os.path.realpath(path) for path in changed_files}
+        selected = {
+            selected_id
+            for selected_id, node in self.nodes.items()
+            if selected_id in only
+            or only.intersection(node["models"])
+            or changed_files.intersection(node["sources"])
+        }
+
+        reverse = self.dependents()
+        pending = list(selected)
+        while pending:
+            for dependent in reverse.get(pending.pop(), ()):
+                if dependent not in selected:
+                    selected.add(dependent)
+                    pending.append(dependent)
+        return selected
+
+
+class Selection:
+    def __init__(self, graph, node_ids, changed_files=()):
+        self.node_ids = set(node_ids)
+        self.changed_files = {os.path.realpath(path) for path in changed_files}
+        nodes = [graph.nodes[selected] for selected in self.node_ids]
+        self.files = {node["file"] for node in nodes}
+        self.app_names = {node["app"] for node in nodes}
+        self.modules = {node["module"] for node in nodes}
+
+    def includes_app(self, app_config):
+        app_path = os.path.realpath(app_config.path) + os.sep
+        return app_config.name in self.app_names or any(
+            path.startswith(app_path) for path in self.changed_files
+        )
+
+    def includes_module(self, module_name, path):
+        return module_name in self.modules or (
+            path is not None and os.path.realpath(path) in self.changed_files
+        )
+
+    def includes(self, app_label, name, source):
+        # Classes defined in a changed file are rendered even when the graph
+        # does not know them yet.
+        return node_id(app_label, name) in self.node_ids or source in self.changed_files
@@ -0,0 +1,74 @@
+from django.apps import apps
+
+
+class TypeIndex:
+    """Where every model and exported serializer of the run is written.
+
+    Built once before rendering, so that resolving a relation is a lookup
+    instead of a walk over the app registry or a naming convention.
+    """
+
+    def __init__(self):
+        # App label -> directory of its files, which is named after the app.
+        self.output_dirs = {}
+        # App name -> app label, to resolve "Model" relative to an app.
+        self.app_labels = {}
+        # Model -> [(app label, name)] of the exported serializers of the model.
+        self.model_serializers = {}
+        # Serializer class -> app label of the app exporting it.
+        self.serializer_labels = {}
+        # Name -> [(app_config, name, serializer class)] of exported serializers.
+        self.serializers = {}
+        # Serializer modules and models whose serializers are indexed, when
+        # the index is filled on demand.
+        self.modules = set()
+        self.indexed_models = set()
+
+    def add_app(self, app_config):
+        self.output_dirs[app_config.label] = app_config.name
+        self.app_labels[app_config.name] = app_config.label
+
+    def add_serializer(self, app_config, name, serializer):
+        self.serializers.setdefault(name, []).append((app_config, name, serializer))
+        self.serializer_labels[serializer] = app_config.label
+        model = getattr(getattr(serializer, "Meta", None), "model", None)
+        if model is not None:
+            self.model_serializers.setdefault(model, []).append(
+                (app_config.label, name)
+            )
+
+    def output_dir(self, app_label):
+        return self.output_dirs.get(app_label, app_label)
+
+    def resolve_model(self, reference, app_name):
+        # A model class, "app_label.Model" or "Model" in the app being
+        # exported; None when no installed model matches. The app registry
+        # is already a lookup table, so models are not copied into the index.
+        if not isinstance(reference, str):
+            return reference
+        if "." not in reference:
+            reference = f"{self.app_labels.get(app_name, app_name)}.{reference}"
+        try:
+            return apps.get_model(reference)
+        except (LookupError, ValueError):
+            return None
+
+    def serializer_for(self, model):
+        """(app label, name) of the serializer standing for the model.
+
+        <Model>Serializer when it exists, as in the model's own app, otherwise
+        the first serializer of the model by name, preferring the model's app.
+        """
+        candidates = self.model_serializers.get(model)
+        if not candidates:
+            return None
+        app_label = model._meta.app_label
+        conventional = f"{model.__name__}Serializer"
+        return min(
+            candidates,
+            key=lambda candidate: (
+                candidate[1] != conventional,
+                candidate[0] != app_label,
+                candidate,
+            ),
+        )
@@ -0,0 +1,340 @@
+import ast
+import os
+import uuid
+import typing
+import inspect
+import datetime
+import decimal
+
+ANY = "any"
+DICT_TYPE = "{ [key: string]: any }"
+
+SIMPLE_TYPES = {
+    int: "number",
+    float: "number",
+    decimal.Decimal: "number",
+    str: "string",
+    bool: "boolean",
+    uuid.UUID: "string",
+    datetime.datetime: "string",
+    datetime.date: "string",
+    datetime.time: "string",
+    type(None): "null",
+    list: "any[]",
+    tuple: "any[]",
+    set: "any[]",
+    frozenset: "any[]",
+    dict: DICT_TYPE,
+    object: ANY,
+}
+
+SIMPLE_NAMES = {
+    "int": "number",
+    "float": "number",
+    "Decimal": "number",
+    "str": "string",
+    "bool": "boolean",
+    "UUID": "string",
+    "datetime": "string",
+    "date": "string",
+    "time": "string",
+    "None": "null",
+    "Any": ANY,
+    "object": ANY,
+}
+
+SEQUENCE_NAMES = {
+    "list",
+    "List",
+    "set",
+    "Set",
+    "frozenset",
+    "FrozenSet",
+    "Sequence",
+    "MutableSequence",
+    "Iterable",
+    "Iterator",
+    "Collection",
+    "AbstractSet",
+}
+MAPPING_NAMES = {
+    "dict",
+    "Dict",
+    "Mapping",
+    "MutableMapping",
+    "OrderedDict",
+    "DefaultDict",
+}
+CALL_TYPES = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "len": "number",
+    "round": "number",
+    "sum": "number",
+    "bool": "boolean",
+    "isinstance": "boolean",
+    "list": "any[]",
+    "sorted": "any[]",
+    "dict": DICT_TYPE,
+}
+
+
+def split_union(ts_type):
+    members = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(ts_type):
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif depth == 0 and ts_type.startswith(" | ", index):
+            members.append(ts_type[start:index])
+            start = index + 3
+    members.append(ts_type[start:])
+    return members
+
+
+def union(ts_types):
+    members = []
+    for ts_type in ts_types:
+        for member in split_union(ts_type):
+            if member not in members:
+                members.append(member)
+    if not members or ANY in members:
+        return ANY
+    return " | ".join(members)
+
+
+def array_of(ts_type):
+    if len(split_union(ts_type)) > 1:
+        return f"({ts_type})[]"
+    return f"{ts_type}[]"
+
+
+def mapping_of(ts_type):
+    return f"{{ [key: string]: {ts_type} }}"
+
+
+def python_type_to_ts(annotation):
+    if annotation is None or annotation is type(None):
+        return "null"
+    if annotation is typing.Any:
+        return ANY
+    if annotation in SIMPLE_TYPES:
+        return SIMPLE_TYPES[annotation]
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is not None:
+        if origin is typing.Union or getattr(origin, "__name__", "") == "UnionType":
+            return union(python_type_to_ts(arg) for arg in args)
+        if origin is typing.Literal:
+            return union(
+                repr(arg) if isinstance(arg, str) else python_type_to_ts(type(arg))
+                for arg in args
+            )
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return array_of(python_type_to_ts(args[0]))
+            return "[" + ", ".join(python_type_to_ts(arg) for arg in args) + "]"
+        name = getattr(origin, "__name__", "")
+        if name in MAPPING_NAMES or issubclass_safe(origin, typing.Mapping):
+            return mapping_of(python_type_to_ts(args[1]) if len(args) == 2 else ANY)
+        if name in SEQUENCE_NAMES or issubclass_safe(origin, typing.Iterable):
+            return array_of(python_type_to_ts(args[0]) if args else ANY)
+        return ANY
+
+    if isinstance(annotation, type):
+        for python_type, ts_type in SIMPLE_TYPES.items():
+            if python_type is not object and issubclass(annotation, python_type):
+                return ts_type
+        return annotation.__name__
+    return ANY
+
+
+def issubclass_safe(cls, parent):
+    try:
+        return isinstance(cls, type) and issubclass(cls, parent)
+    except TypeError:
+        return False
+
+
+def annotation_node_to_ts(node):
+    if node is None:
+        return ANY
+    if isinstance(node, ast.Constant):
+        if node.value is None:
+            return "null"
+        if isinstance(node.value, str):
+            # Forward reference written as a string.
+            try:
+                return annotation_node_to_ts(ast.parse(node.value, mode="eval").body)
+            except SyntaxError:
+                return ANY
+        return ANY
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return union(
+            [annotation_node_to_ts(node.left), annotation_node_to_ts(node.right)]
+        )
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        name = node.id if isinstance(node, ast.Name) else node.attr
+        if name in SIMPLE_NAMES:
+            return SIMPLE_NAMES[name]
+        if name in SEQUENCE_NAMES or name in ("tuple", "Tuple"):
+            return "any[]"
+        if name in MAPPING_NAMES:
+            return DICT_TYPE
+        return name
+    if isinstance(node, ast.Subscript):
+        base = (
+            node.value.id
+            if isinstance(node.value, ast.Name)
+            else getattr(node.value, "attr", "")
+        )
+        slice_node = node.slice
+        if isinstance(slice_node, getattr(ast, "Index", ())):  # Python < 3.9
+            slice_node = slice_node.value
+        args = (
+            list(slice_node.elts) if isinstance(slice_node, ast.Tuple) else [slice_node]
+        )
+
+        if base == "Optional":
+            return union([annotation_node_to_ts(args[0]), "null"])
+        if base == "Union":
+            return union(annotation_node_to_ts(arg) for arg in args)
+        if base == "Literal":
+            return union(
+                (
+                    repr(arg.value)
+                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+                    else annotation_node_to_ts(arg)
+                )
+                for arg in args
+            )
+        if base in SEQUENCE_NAMES:
+            return array_of(annotation_node_to_ts(args[0]))
+        if base in MAPPING_NAMES:
+            return mapping_of(
+                annotation_node_to_ts(args[-1]) if len(args) == 2 else ANY
+            )
+        if base in ("tuple", "Tuple"):
+            if (
+                len(args) == 2
+                and isinstance(args[1], ast.Constant)
+                and args[1].value is Ellipsis
+            ):
+                return array_of(annotation_node_to_ts(args[0]))
+            return "[" + ", ".join(annotation_node_to_ts(arg) for arg in args) + "]"
+    return ANY
+
+
+def expression_to_ts(node):
+    if node is None:
+        return "null"
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if value is None:
+            return "null"
+        if isinstance(value, bool):
+            return "boolean"
+        if isinstance(value, (int, float)):
+            return "number"
+        if isinstance(value, str):
+            return "string"
+        return ANY
+    if isinstance(node, ast.JoinedStr):
+        return "string"
+    if isinstance(node, (ast.Dict, ast.DictComp)):
+        return DICT_TYPE
+    if isinstance(node, (ast.List, ast.ListComp, ast.Set, ast.SetComp, ast.Tuple)):
+        return "any[]"
+    if isinstance(node, ast.Compare) or (
+        isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not)
+    ):
+        return "boolean"
+    if isinstance(node, ast.IfExp):
+        return union([expression_to_ts(node.body), expression_to_ts(node.orelse)])
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return CALL_TYPES.get(node.func.id, ANY)
+    return ANY
+
+
+def iter_returns(node):
+    for child in ast.iter_child_nodes(node):
+        if isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+        ):
+            continue
+        if isinstance(child, ast.Return):
+            yield child
+        else:
+            yield from iter_returns(child)
+
+
+class SourceCache:
+    def __init__(self):
+        self.modules = {}
+        self.parses = 0
+
+    def get_functions(self, path):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return {}
+
+        cached = self.modules.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        self.parses += 1
+        functions = {}
+        self.index_functions(tree, "", functions)
+        self.modules[path] = (mtime_ns, functions)
+        return functions
+
+    def index_functions(self, node, prefix, functions):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = f"{prefix}{child.name}"
+                functions[qualname] = child
+                self.index_functions(child, f"{qualname}.<locals>.", functions)
+            elif isinstance(child, ast.ClassDef):
+                self.index_functions(child, f"{prefix}{child.name}.", functions)
+            else:
+                self.index_functions(child, prefix, functions)
+
+    def get_function_node(self, function):
+        code = getattr(function, "__code__", None)
+        if code is None:
+            return None
+        return self.get_functions(code.co_filename).get(function.__qualname__)
+
+
+source_cache = SourceCache()
+
+
+def infer_return_type(function, cache=source_cache):
+    function = inspect.unwrap(function)
+
+    try:
+        hints = typing.get_type_hints(function)
+    except Exception:
+        hints = None
+    if hints and "return" in hints:
+        return python_type_to_ts(hints["return"])
+
+    node = cache.get_function_node(function)
+    if node is None:
+        return ANY
+    if node.returns is not None:
+        # The annotation exists but could not be evaluated at runtime.
+        return annotation_node_to_ts(node.returns)
+
+    returns = list(iter_returns(node))
+    if not returns:
+        return ANY
+    return union(expression_to_ts(statement.value) for statement in returns)
@@ -0,0 +1,81 @@
+def serializer_key(serializer_class):
+    if serializer_class.__qualname__ == serializer_class.__name__:
+        return serializer_class
+
+    # Classes built on the fly (e.g. DRF's NestedSerializer for Meta.depth)
+    # are new objects on every get_fields() call, so they are keyed by what
+    # determines their shape instead.
+    meta = getattr(serializer_class, "Meta", None)
+    return (
+        serializer_class.__module__,
+        serializer_class.__qualname__,
+        getattr(meta, "model", None),
+        getattr(meta, "depth", 0),
+        repr(getattr(meta, "fields", None)),
+        repr(getattr(meta, "exclude", None)),
+        tuple(getattr(serializer_class, "_declared_fields", {})),
+    )
+
+
+class IntrospectionCache:
+    def __init__(self, track_dependencies=True):
+        self.fields = {}
+        self.resolved = {}
+        self.resolving = []
+        self.cycles = []
+        # Serializers resolved while resolving another one, by key. Only the
+        # dependency graph needs them, and they grow with the project.
+        self.track_dependencies = track_dependencies
+        self.dependencies = {}
+
+    def get_fields(self, serializer_class):
+        key = serializer_key(serializer_class)
+        try:
+            return self.fields[key]
+        except KeyError:
+            fields = self.fields[key] = serializer_class().get_fields()
+            return fields
+
+    def resolve(self, serializer_class, resolver):
+        key = serializer_key(serializer_class)
+        if self.resolving and self.track_dependencies:
+            self.dependencies.setdefault(self.resolving[-1], {})[key] = serializer_class
+        try:
+            return self.resolved[key]
+        except KeyError:
+            pass
+
+        if key in self.resolving:
+            # Keys of classes built on the fly hold their qualified name.
+            path = [
+                getattr(k, "__name__", None) or k[1].rpartition(".")[2]
+                for k in self.resolving
+            ]
+            self.cycles.append(path + [serializer_class.__name__])
+            return None
+
+        self.resolving.append(key)
+        try:
+            result = resolver()
+        finally:
+            self.resolving.pop()
+            if not self.resolving:
+                # Bound fields are only needed to resolve; keeping the DRF
+                # field instances of every serializer would grow with the
+                # project.
+                self.fields.clear()
+        self.resolved[key] = result
+        return result
+
+    def forget(self, serializer_class):
+        self.resolved.pop(serializer_key(serializer_class), None)
+
+    def nested(self, serializer_class):
+        seen = {}
+        pending = [serializer_key(serializer_class)]
+        while pending:
+            for key, nested_class in self.dependencies.get(pending.pop(), {}).items():
+                if key not in seen:
+                    seen[key] = nested_class
+                    pending.append(key)
+        return list(seen.values())
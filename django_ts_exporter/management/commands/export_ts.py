@@ -0,0 +1,20 @@
+from argparse import Namespace
+from django.core.management.base import BaseCommand, CommandError
+from ...exporter import add_arguments, exporter_from_arguments, validate_arguments
+
+
+class Command(BaseCommand):
+    help = "Export Django models and serializers to TypeScript interfaces."
+
+    def add_arguments(self, parser):
+        add_arguments(parser)
+
+    def handle(self, *args, **options):
+        options = Namespace(**options)
+        error = validate_arguments(options)
+        if error:
+            raise CommandError(error)
+
+        # Django is already set up, so there is no manage.py to look for.
+        if exporter_from_arguments(options).export():
+            raise CommandError("The generated files are out of date.")
@@ -0,0 +1,105 @@
+import os
+import json
+import hashlib
+from .utils import create_directory, write_file
+
+MANIFEST_FILENAME = ".ts-exporter-manifest.json"
+
+
+def hash_content(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    def __init__(self, outdir):
+        self.outdir = outdir
+        self.path = os.path.join(outdir, MANIFEST_FILENAME)
+        self.entries = self.load()
+        self.seen = set()
+        self.written = []
+        self.skipped = []
+        self.removed = []
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("files", {})
+
+    def save(self):
+        create_directory(self.outdir)
+        data = {"files": dict(sorted(self.entries.items()))}
+        write_file(self.path, json.dumps(data, indent=2) + "\n")
+
+    def is_unchanged(self, relpath, digest):
+        full_path = os.path.join(self.outdir, relpath)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return False
+
+        entry = self.entries.get(relpath)
+        if entry and entry["hash"] == digest and entry["mtime_ns"] == stat.st_mtime_ns:
+            return True
+
+        # No entry yet, or the file was touched outside the exporter: compare
+        # the content on disk before deciding to rewrite it.
+        with open(full_path, "r", encoding="utf-8") as f:
+            if hash_content(f.read()) != digest:
+                return False
+        self.entries[relpath] = {"hash": digest, "mtime_ns": stat.st_mtime_ns}
+        return True
+
+    def write(self, relpath, content):
+        relpath = relpath.replace(os.sep, "/")
+        digest = hash_content(content)
+        self.seen.add(relpath)
+
+        if self.is_unchanged(relpath, digest):
+            self.skipped.append(relpath)
+            return False
+
+        full_path = os.path.join(self.outdir, relpath)
+        create_directory(os.path.dirname(full_path))
+        write_file(full_path, content)
+        self.entries[relpath] = {
+            "hash": digest,
+            "mtime_ns": os.stat(full_path).st_mtime_ns,
+        }
+        self.written.append(relpath)
+        return True
+
+    def forget(self, prefix):
+        self.seen = {relpath for relpath in self.seen if not relpath.startswith(prefix)}
+        self.written = []
+        self.skipped = []
+        self.removed = []
+
+    def retain(self, relpaths):
+        # Files kept as they are by a partial export count as seen.
+        self.seen.update(relpaths)
+
+    def prune(self, prefix=""):
+        stale = [
+            relpath
+            for relpath in set(self.entries) - self.seen
+            if relpath.startswith(prefix)
+        ]
+        for relpath in sorted(stale):
+            full_path = os.path.join(self.outdir, relpath)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+                self.remove_empty_dirs(os.path.dirname(full_path))
+            del self.entries[relpath]
+            self.removed.append(relpath)
+
+    def remove_empty_dirs(self, path):
+        outdir = os.path.abspath(self.outdir)
+        path = os.path.abspath(path)
+        while path != outdir and path.startswith(outdir) and not os.listdir(path):
+            os.rmdir(path)
+            path = os.path.dirname(path)
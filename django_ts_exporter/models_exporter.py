@@ -1,192 +1,107 @@
-import os
-import inspect
-import importlib
-from django.apps import apps
 from django.db import models
-from .utils import create_directory
-
-
-class ModelsExporter:
-    def __init__(self, outdir, apps, enable_logs):
-        self.outdir = outdir
-        self.apps = apps
-        self.enable_logs = enable_logs
-        self.any_fields_log = []
-
-    def export(self):
-        for app in self.apps:
-            app_config = apps.get_app_config(app.split(".")[-1])
-            models_module = f"{app_config.name}.models"
-
-            if importlib.util.find_spec(models_module):
-                module = importlib.import_module(models_module)
-                self.export_models(module, app_config)
-
-            models_path = os.path.join(app_config.path, "models")
-            if os.path.isdir(models_path):
-                for root, _, files in os.walk(models_path):
-                    for file in files:
-                        if file.endswith(".py") and file != "__init__.py":
-                            module_name = f"{app_config.name}.models.{file[:-3]}"
-                            module = importlib.import_module(module_name)
-                            self.export_models(module, app_config)
-
-        if self.enable_logs:
-            self.log_any_fields()
-
-    def export_models(self, module, app_config):
-        app_outdir = os.path.join(self.outdir, app_config.name)
-        create_directory(app_outdir)
-
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, models.Model) and obj.__module__ == module.__name__:
-                ts_interface, imports = self.convert_model_to_ts_interface(
-                    name, obj, app_config.name
-                )
-                self.write_interface(app_outdir, name, ts_interface, imports)
+from .base_exporter import BaseExporter
+from .field_types import model_field_types
+from .schema import Array, Field, Interface, Reference, from_handler_result
+
+
+class ModelsExporter(BaseExporter):
+    source = "models"
+    field_types = model_field_types
+
+    def iter_app(self, app):
+        app_config = self.get_app_config(app)
+
+        for model in self.get_models(app_config):
+            name = model.__name__
+            if not self.is_selected(app_config, name, model):
+                continue
+            with self.profiler.item("model", f"{app_config.label}.{name}"):
+                interface = self.build_model_interface(name, model, app_config)
+            yield interface
+
+    def get_models(self, app_config):
+        # The app registry already holds every concrete model of the app after
+        # django.setup(), wherever it is defined, including proxy and unmanaged
+        # models, so there is no need to walk and import the models modules.
+        return sorted(app_config.get_models(), key=lambda model: model.__name__)
+
+    def get_related_type(self, related_model, app_name):
+        model = self.type_index().resolve_model(related_model, app_name)
+        if model is None:
+            # A lazy reference to a model that is not installed.
+            app_label, _, name = related_model.rpartition(".")
+            return Reference(name, app_label or app_name)
+        return Reference(model.__name__, model._meta.app_label)
+
+    def get_ts_type(self, field, field_name, app_name, model_name, original_model=None):
+        handler = self.field_types.lookup(type(field))
+        if handler is None:
+            return "any"
+        if isinstance(handler, str):
+            return handler
+        return from_handler_result(
+            handler(self, field, field_name, app_name, model_name, original_model)
+        )
 
-    def get_related_type_and_import(
-        self, related_model, related_serializer, app_name, model_name
+    def get_related_field_type(
+        self, field, field_name, app_name, model_name, original_model=None
     ):
-        if related_serializer != model_name:  # Avoid self-import
-            related_model_name = (
-                related_model
-                if isinstance(related_model, str)
-                else related_model.__name__
-            )
-            related_app_label = (
-                related_model._meta.app_label
-                if hasattr(related_model, "_meta")
-                else app_name
-            )
+        return self.get_related_type(field.related_model, app_name)
 
-            if related_app_label == app_name:
-                import_path = f"./{related_model_name}.ts"
-            else:
-                import_path = f"../{related_app_label}/{related_model_name}.ts"
-            return (
-                related_model_name,
-                f'import {{ {related_model_name} }} from "{import_path}";',
-            )
-        else:
-            return related_serializer, None
-
-    def get_ts_type(self, field, field_name, app_name, model_name):
-        if isinstance(field, models.CharField):
-            return "string", None
-        elif isinstance(field, models.IntegerField):
-            return "number", None
-        elif isinstance(field, models.BooleanField):
-            return "boolean", None
-        elif isinstance(field, models.DateTimeField):
-            return "string", None  # DateTimeField can be represented as ISO 8601 string
-        elif isinstance(field, models.DateField):
-            return "string", None  # DateField can be represented as ISO 8601 string
-        elif isinstance(field, models.DecimalField):
-            return "number", None  # DecimalField can be represented as number
-        elif isinstance(field, models.UUIDField):
-            return "string", None  # UUIDField can be represented as string
-        elif isinstance(field, models.JSONField):
-            return (
-                "{ [key: string]: any }",
-                None,
-            )  # JSONField can be represented as dictionary
-        elif isinstance(field, models.ForeignKey):
-            related_model = field.related_model
-            related_serializer = (
-                related_model
-                if isinstance(related_model, str)
-                else related_model.__name__
-            )
-            return self.get_related_type_and_import(
-                related_model, related_serializer, app_name, model_name
-            )
-        elif isinstance(field, models.ManyToManyField):
-            related_model = field.related_model
-            related_serializer = (
-                related_model
-                if isinstance(related_model, str)
-                else related_model.__name__
-            )
-            ts_type, import_statement = self.get_related_type_and_import(
-                related_model, related_serializer, app_name, model_name
-            )
-            return f"{ts_type}[]", import_statement
-        elif isinstance(field, models.OneToOneField):
-            related_model = field.related_model
-            related_serializer = (
-                related_model
-                if isinstance(related_model, str)
-                else related_model.__name__
-            )
-            return self.get_related_type_and_import(
-                related_model, related_serializer, app_name, model_name
-            )
-        elif isinstance(field, models.FileField):
-            return "File", None
-        return "any", None
-
-    def handle_field_with_choices(self, field, field_name, model_name):
-        enum_name = f"{model_name}{field_name.capitalize()}Enum"
-        choices = field.choices
-        enum_definition = f"export enum {enum_name} {{\n"
-        for value, label in choices.items():
-            enum_definition += (
-                f"  {label.replace(' ', '_').replace('�', 'í')} = '{value}',\n"
+    def get_many_to_many_field_type(
+        self, field, field_name, app_name, model_name, original_model=None
+    ):
+        return Array(
+            self.get_related_field_type(
+                field, field_name, app_name, model_name, original_model
             )
-        enum_definition += "}\n"
-        return enum_name, enum_definition
+        )
 
-    def convert_model_to_ts_interface(self, name, model, app_name):
-        fields = model._meta.get_fields()
+    def build_model_interface(self, name, model, app_config):
+        with self.profiler.phase("introspection"):
+            fields = model._meta.get_fields()
         ts_fields = []
-        imports = set()
-        enums = set()
 
         for field in fields:
             if isinstance(field, models.Field):
-                ts_type, enum_definition = self.get_ts_type(
-                    field, field.name, app_name, name
+                ts_type = self.get_ts_type(
+                    field, field.name, app_config.name, name, original_model=model
                 )
-                ts_fields.append(f"{field.name}: {ts_type};")
-
                 if ts_type == "any":
-                    self.any_fields_log.append(f"{app_name}.{name}.{field.name}")
-                if enum_definition:
-                    if "export enum" in enum_definition:
-                        enums.add(enum_definition)
-                    elif enum_definition:
-                        imports.add(enum_definition)
-
-        import_statements = "\n".join(sorted(imports))
-        enum_statements = "\n".join(sorted(enums))
-
-        interface = (
-            f"export interface {name} {{\n  " + "\n  ".join(ts_fields) + "\n}\n\n"
+                    self.diagnostics.any_field(f"{app_config.name}.{name}.{field.name}")
+                ts_fields.append(Field(field.name, ts_type))
+
+        return Interface(
+            app_config.name,
+            app_config.label,
+            name,
+            tuple(ts_fields),
+            model.__module__,
+            (model._meta.label,),
+            self.graph_sources(model),
         )
 
-        result = ""
-
-        if import_statements:
-            result = f"{import_statements}\n\n"
-
-        if enum_statements:
-            result = result + f"{enum_statements}\n\n"
-
-        if interface:
-            result = result + f"{interface}"
-
-        return result, list(imports)
-
-    def write_interface(self, app_outdir, name, ts_interface, imports):
-        interface_path = os.path.join(app_outdir, f"{name}.ts")
-        with open(interface_path, "w", encoding="utf-8") as f:
-            f.write(ts_interface)
-
-    def log_any_fields(self):
-        if self.any_fields_log:
-            print("\nFields with 'any' type detected:")
-            for field in self.any_fields_log:
-                print(field)
-        else:
-            print("\nNo fields with 'any' type detected.")
+    def convert_model_to_ts_interface(self, name, model, app_name):
+        interface = self.build_model_interface(
+            name, model, self.get_app_config(app_name)
+        )
+        return self.emitter.interface(interface), interface.references
+
+
+DEFAULT_FIELD_TYPES = {
+    models.CharField: "string",
+    models.IntegerField: "number",
+    models.BooleanField: "boolean",
+    models.DateTimeField: "string",  # ISO 8601 string
+    models.DateField: "string",  # ISO 8601 string
+    models.DecimalField: "number",
+    models.UUIDField: "string",
+    models.JSONField: "{ [key: string]: any }",
+    models.ForeignKey: ModelsExporter.get_related_field_type,
+    models.OneToOneField: ModelsExporter.get_related_field_type,
+    models.ManyToManyField: ModelsExporter.get_many_to_many_field_type,
+    models.FileField: "File",
+}
+
+for field_class, handler in DEFAULT_FIELD_TYPES.items():
+    model_field_types.register_default(field_class, handler)
@@ -0,0 +1,166 @@
+import json
+import time
+import cProfile
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+
+class NullProfiler:
+    def phase(self, name):
+        return nullcontext()
+
+    def app(self, app):
+        return nullcontext()
+
+    def item(self, kind, name):
+        return nullcontext()
+
+    def add_file(self, relpath, content):
+        pass
+
+    def clear(self):
+        pass
+
+    def snapshot(self):
+        return None
+
+    def merge(self, snapshot):
+        pass
+
+
+class Profiler(NullProfiler):
+    def __init__(self, top=10, dump_path=None):
+        self.top = top
+        self.dump_path = dump_path
+        self.cprofile = None
+        self.started = None
+        self.total = 0.0
+        self.peak_memory = None
+        self.files = {}
+        self.stack = []
+        self.clear()
+
+    def clear(self):
+        self.phases = defaultdict(float)
+        self.apps = defaultdict(float)
+        self.items = defaultdict(list)
+
+    def start(self):
+        tracemalloc.start()
+        if self.dump_path:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.total = time.perf_counter() - self.started
+        if self.cprofile:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.dump_path)
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name):
+        # Phases are exclusive: time spent in a nested phase (e.g. an import
+        # while rendering) only counts for the nested one.
+        self.stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.phases[name] += elapsed - self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+
+    @contextmanager
+    def app(self, app):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.apps[app] += time.perf_counter() - started
+
+    @contextmanager
+    def item(self, kind, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.items[kind].append((time.perf_counter() - started, name))
+
+    def add_file(self, relpath, content):
+        self.files[relpath] = len(content.encode("utf-8"))
+
+    def snapshot(self):
+        return dict(self.phases), dict(self.apps), dict(self.items)
+
+    def merge(self, snapshot):
+        # Timings recorded by parallel workers add up as CPU time.
+        phases, apps, items = snapshot
+        for name, seconds in phases.items():
+            self.phases[name] += seconds
+        for app, seconds in apps.items():
+            self.apps[app] += seconds
+        for kind, timings in items.items():
+            self.items[kind] += timings
+
+    def report(self, manifest=None):
+        if manifest:
+            written = manifest.written
+            skipped = manifest.skipped
+        else:
+            written = list(self.files)
+            skipped = []
+
+        return {
+            "total": self.total,
+            "phases": dict(sorted(self.phases.items(), key=lambda p: -p[1])),
+            "apps": dict(sorted(self.apps.items(), key=lambda a: -a[1])),
+            "slowest": {
+                kind: [
+                    {"name": name, "seconds": seconds}
+                    for seconds, name in sorted(timings, reverse=True)[: self.top]
+                ]
+                for kind, timings in sorted(self.items.items())
+            },
+            "files": {
+                "written": len(written),
+                "skipped": len(skipped),
+                "bytes_written": sum(self.files.get(path, 0) for path in written),
+            },
+            "peak_memory": self.peak_memory,
+        }
+
+    def write_report(self, path, manifest=None):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(manifest), f, indent=2)
+            f.write("\n")
+
+    def print_report(self, manifest=None):
+        report = self.report(manifest)
+        total = report["total"] or 1.0
+
+        print(f"\nProfile: {report['total']:.3f}s in total")
+        print("Phases:")
+        for name, seconds in report["phases"].items():
+            print(f"  {name:<16} {seconds:8.3f}s {seconds / total:6.1%}")
+        print("Apps:")
+        for app, seconds in list(report["apps"].items())[: self.top]:
+            print(f"  {app:<32} {seconds:8.3f}s")
+        for kind, slowest in report["slowest"].items():
+            print(f"Slowest {kind}s:")
+            for entry in slowest:
+                print(f"  {entry['name']:<48} {entry['seconds'] * 1000:8.1f}ms")
+
+        files = report["files"]
+        print(
+            f"Files: {files['written']} written, {files['skipped']} skipped, "
+            f"{files['bytes_written'] / 1024:.1f} KiB written"
+        )
+        if report["peak_memory"] is not None:
+            print(f"Peak memory: {report['peak_memory'] / 1024 / 1024:.1f} MiB")
+        if self.dump_path:
+            print(f"cProfile stats written to {self.dump_path}")
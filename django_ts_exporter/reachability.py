@@ -0,0 +1,130 @@
+import inspect
+from django.urls import URLResolver, get_resolver
+from rest_framework import serializers
+from .graph import node_id
+
+# Methods of a view that may pick or instantiate its serializers, besides the
+# handlers of its HTTP methods or viewset actions.
+SERIALIZER_METHODS = ("get_serializer_class", "get_serializer")
+
+
+def iter_callbacks(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_callbacks(pattern.url_patterns)
+        else:
+            yield pattern.callback
+
+
+def code_names(code):
+    # Names used by the function and by the functions and lambdas nested in it.
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= code_names(const)
+    return names
+
+
+def referenced_objects(function, view_class, seen=None):
+    """Objects a function may reach by name, without calling it.
+
+    Names are looked up in the module of the function, in modules it uses
+    (serializers.OrderSerializer) and on the view class
+    (self.serializer_classes[self.action]). Functions wrapped by decorators,
+    e.g. @api_view handlers, are followed through their closure.
+    """
+    seen = set() if seen is None else seen
+    function = inspect.unwrap(function)
+    code = getattr(function, "__code__", None)
+    if code is None or function in seen:
+        return []
+    seen.add(function)
+
+    names = code_names(code)
+    objects = [function.__globals__[name] for name in names & set(function.__globals__)]
+    objects += [
+        getattr(view_class, name) for name in names if hasattr(view_class, name)
+    ]
+    objects += [
+        getattr(module, name)
+        for module in objects
+        if inspect.ismodule(module)
+        for name in names
+        if hasattr(module, name)
+    ]
+
+    for cell in function.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:  # Empty cell.
+            continue
+        if inspect.isfunction(contents):
+            objects += referenced_objects(contents, view_class, seen)
+        else:
+            objects.append(contents)
+
+    # Serializers picked from a mapping or list, e.g. per action.
+    for container in list(objects):
+        if isinstance(container, dict):
+            objects += container.values()
+        elif isinstance(container, (list, tuple, set, frozenset)):
+            objects += container
+    return objects
+
+
+def view_serializers(callback):
+    # Importing DRF views reads the settings, which the command line tool
+    # configures after importing this module.
+    from rest_framework.views import APIView
+
+    view_class = getattr(callback, "cls", None)
+    if not (inspect.isclass(view_class) and issubclass(view_class, APIView)):
+        return set()
+
+    # Routers pass the options of @action(...) as initkwargs.
+    initkwargs = getattr(callback, "initkwargs", None) or {}
+    candidates = [initkwargs.get("serializer_class")]
+    candidates.append(getattr(view_class, "serializer_class", None))
+
+    actions = getattr(callback, "actions", None)
+    handlers = set(actions.values()) if actions else set(view_class.http_method_names)
+    for name in sorted(handlers.union(SERIALIZER_METHODS)):
+        method = getattr(view_class, name, None)
+        if inspect.isfunction(method):
+            candidates += referenced_objects(method, view_class)
+
+    return {
+        candidate
+        for candidate in candidates
+        if inspect.isclass(candidate)
+        and issubclass(candidate, serializers.BaseSerializer)
+    }
+
+
+def api_serializers(urlconf=None):
+    """Serializer classes used by the DRF views of the URLconf."""
+    found = set()
+    for callback in iter_callbacks(get_resolver(urlconf).url_patterns):
+        found |= view_serializers(callback)
+    return found
+
+
+class Reachable:
+    # Limits rendering to the serializers reachable from the API, with the
+    # interface of graph.Selection.
+    def __init__(self, exported):
+        # (app_config, name, serializer class) of the reachable serializers.
+        self.node_ids = {
+            node_id(app_config.label, name) for app_config, name, _ in exported
+        }
+        self.app_names = {app_config.name for app_config, _, _ in exported}
+        self.modules = {serializer.__module__ for _, _, serializer in exported}
+
+    def includes_app(self, app_config):
+        return app_config.name in self.app_names
+
+    def includes_module(self, module_name, path):
+        return module_name in self.modules
+
+    def includes(self, app_label, name, source):
+        return node_id(app_label, name) in self.node_ids
@@ -0,0 +1,105 @@
+from collections import namedtuple
+
+# Intermediate representation between introspection and emitters. Nodes are
+# namedtuples: immutable, hashable, comparable and without a per-instance
+# __dict__, so they can be cached, diffed and pickled to parallel workers.
+#
+# A type is either a TypeScript type string ("string", "number | null", ...)
+# or one of the type nodes below.
+
+# Another exported interface.
+Reference = namedtuple("Reference", ["name", "app_label"])
+# An array of the item type.
+Array = namedtuple("Array", ["item"])
+# An object type written inline; fields is a tuple of Field.
+InlineObject = namedtuple("InlineObject", ["fields"])
+# An enum declared next to the interface; members are (key, value) pairs and
+# labels the original label of each member, when known.
+Enum = namedtuple("Enum", ["name", "members", "labels"], defaults=((),))
+# A type string that needs the given references imported, as returned by
+# handlers using the (ts_type, import) tuples of earlier versions.
+Raw = namedtuple("Raw", ["ts_type", "references"])
+
+Field = namedtuple("Field", ["name", "type"])
+
+
+def walk(ts_type):
+    """Yield the type and every node nested in it."""
+    yield ts_type
+    if isinstance(ts_type, Array):
+        yield from walk(ts_type.item)
+    elif isinstance(ts_type, InlineObject):
+        for field in ts_type.fields:
+            yield from walk(field.type)
+    elif isinstance(ts_type, Raw):
+        yield from ts_type.references
+
+
+def map_type(ts_type, function):
+    """Rebuild the type bottom-up, replacing every node with function(node)."""
+    if isinstance(ts_type, Array):
+        ts_type = Array(map_type(ts_type.item, function))
+    elif isinstance(ts_type, InlineObject):
+        ts_type = InlineObject(
+            tuple(Field(f.name, map_type(f.type, function)) for f in ts_type.fields)
+        )
+    return function(ts_type)
+
+
+def from_handler_result(result):
+    # Handlers return a type; older ones return (ts_type, extra) tuples.
+    if type(result) is not tuple:  # Nodes are tuple subclasses.
+        return result
+
+    ts_type, extra = result
+    if extra is None:
+        return ts_type
+    if not isinstance(extra, Reference):
+        raise TypeError(f"Unsupported field type extra: {extra!r}")
+    if ts_type == extra.name:
+        return extra
+    if ts_type == f"{extra.name}[]":
+        return Array(extra)
+    return Raw(ts_type, (extra,))
+
+
+class Interface(
+    namedtuple(
+        "Interface",
+        ["app_name", "app_label", "name", "fields", "module", "models", "sources"],
+        defaults=(None, (), ()),
+    )
+):
+    # module, models and sources feed the dependency graph: the module defining
+    # the class, the labels of the models its shape depends on and their files.
+    __slots__ = ()
+
+    def nodes(self):
+        # Type nodes of the fields; most fields are plain type strings, which
+        # hold none.
+        for field in self.fields:
+            if not isinstance(field.type, str):
+                yield from walk(field.type)
+
+    @property
+    def references(self):
+        # Interfaces never import themselves.
+        return sorted(
+            {
+                node
+                for node in self.nodes()
+                if isinstance(node, Reference) and node.name != self.name
+            }
+        )
+
+    @property
+    def enums(self):
+        return {node for node in self.nodes() if isinstance(node, Enum)}
+
+    def replace_types(self, function):
+        return self._replace(
+            fields=tuple(
+                Field(field.name, map_type(field.type, function))
+                for field in self.fields
+            )
+        )
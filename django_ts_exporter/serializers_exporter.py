@@ -1,69 +1,234 @@
 import os
 import inspect
 import importlib
-from django.apps import apps
 from rest_framework import serializers
-from .utils import create_directory
+from .base_exporter import BaseExporter
+from .discovery import serializer_scanner
+from .enums import choices_enum
+from .field_types import serializer_field_types
+from .inference import infer_return_type
+from .introspection import IntrospectionCache
+from .reachability import Reachable, api_serializers
+from .schema import (
+    Array,
+    Field,
+    InlineObject,
+    Interface,
+    Reference,
+    from_handler_result,
+    walk,
+)
 
 
-class SerializersExporter:
-    def __init__(self, outdir, apps, enable_logs):
-        self.outdir = outdir
-        self.apps = apps
-        self.enable_logs = enable_logs
-        self.any_fields_log = []
+class SerializersExporter(BaseExporter):
+    source = "serializers"
+    field_types = serializer_field_types
+    scanner = serializer_scanner
+
+    def __init__(self, *args, reachable_only=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reachable_only = reachable_only
+        self.introspection = IntrospectionCache(self.keeps_graph)
 
     def export(self):
-        for app in self.apps:
-            app_config = apps.get_app_config(app.split(".")[-1])
-            serializers_module = f"{app_config.name}.serializers"
-
-            if importlib.util.find_spec(serializers_module):
-                module = importlib.import_module(serializers_module)
-                self.export_serializers(module, app_config)
-
-            serializers_path = os.path.join(app_config.path, "serializers")
-            if os.path.isdir(serializers_path):
-                for root, _, files in os.walk(serializers_path):
-                    for file in files:
-                        if file.endswith(".py") and file != "__init__.py":
-                            module_name = f"{app_config.name}.serializers.{file[:-3]}"
-                            module = importlib.import_module(module_name)
-                            self.export_serializers(module, app_config)
-
-        if self.enable_logs:
-            self.log_any_fields()
-
-    def export_serializers(self, module, app_config):
-        app_outdir = os.path.join(self.outdir, app_config.name)
-        create_directory(app_outdir)
+        if self.reachable_only:
+            self.selection = self.find_reachable()
+        return super().export()
+
+    def refresh_app(self, app):
+        # Reloaded modules define new classes; drop what was cached for the old ones.
+        self.introspection = IntrospectionCache(self.keeps_graph)
+        super().refresh_app(app)
+
+    def iter_app(self, app):
+        app_config = self.get_app_config(app)
+
+        with self.profiler.phase("discovery"):
+            module_names = self.find_serializer_modules(app_config, self.selection)
+        for module_name in module_names:
+            module = self.import_module(module_name)
+            yield from self.render_serializers(module, app_config)
+
+    def import_module(self, module_name):
+        with self.profiler.phase("import"):
+            return importlib.import_module(module_name)
+
+    def find_serializer_modules(self, app_config, selection=None):
+        serializers_module = f"{app_config.name}.serializers"
+        candidates = []
+
+        spec = importlib.util.find_spec(serializers_module)
+        if spec:
+            candidates.append((serializers_module, spec.origin))
+
+        serializers_path = os.path.join(app_config.path, "serializers")
+        if os.path.isdir(serializers_path):
+            for root, _, files in os.walk(serializers_path):
+                package = os.path.relpath(root, serializers_path).replace(os.sep, ".")
+                for file in sorted(files):
+                    if file.endswith(".py") and file != "__init__.py":
+                        parts = [serializers_module, file[:-3]]
+                        if package != ".":
+                            parts.insert(1, package)
+                        candidates.append((".".join(parts), os.path.join(root, file)))
+
+        if selection:
+            candidates = [
+                (module_name, path)
+                for module_name, path in candidates
+                if selection.includes_module(module_name, path)
+            ]
 
+        # Only import modules that may define serializers; importing runs all of
+        # a module's side effects.
+        return [
+            module_name
+            for module_name, path in candidates
+            if self.scanner.needs_import(path)
+        ]
+
+    def find_serializers(self, module):
         for name, obj in inspect.getmembers(module, inspect.isclass):
             if (
                 issubclass(obj, serializers.ModelSerializer)
                 and obj.__module__ == module.__name__
             ):
-                ts_interface, imports = self.convert_serializer_to_ts_interface(
-                    name, obj, app_config.name
-                )
-                self.write_interface(app_outdir, name, ts_interface, imports)
+                yield name, obj
 
-    def get_related_type_and_import(
-        self, related_model, related_serializer, app_name, serializer_name
-    ):
-        if related_serializer != serializer_name:  # Avoid self-import
-            if related_model._meta.app_label == app_name:
-                import_path = f"./{related_serializer}.ts"
-            else:
-                import_path = (
-                    f"../{related_model._meta.app_label}/{related_serializer}.ts"
+    def referenced_serializers(self, reference, exported):
+        # References carry the app label of the model; serializers with the
+        # same name in other apps only match when none is in that app.
+        candidates = exported.get(reference.name, [])
+        in_app = [
+            serializer
+            for app_config, _, serializer in candidates
+            if app_config.label == reference.app_label
+        ]
+        return in_app or [serializer for _, _, serializer in candidates]
+
+    def render_serializers(self, module, app_config):
+        for name, obj in self.find_serializers(module):
+            if self.is_selected(app_config, name, obj):
+                with self.profiler.item("serializer", f"{app_config.label}.{name}"):
+                    interface = self.build_serializer_interface(name, obj, app_config)
+                if not self.reachable_only:
+                    # Exported serializers are referenced, never inlined, so
+                    # their fields are not needed again once rendered.
+                    self.introspection.forget(obj)
+                yield interface
+
+    def build_index(self):
+        # Every exported serializer of the run. Partial runs only import the
+        # modules they render, so their index is filled on demand instead
+        # (see index_serializers_of).
+        index = super().build_index()
+        if not self.partial:
+            for app in self.apps:
+                self.index_app(index, self.get_app_config(app))
+        return index
+
+    def index_app(self, index, app_config):
+        for module_name in self.find_serializer_modules(app_config):
+            self.index_module(index, app_config, module_name)
+
+    def index_module(self, index, app_config, module_name):
+        if module_name in index.modules:
+            return
+        index.modules.add(module_name)
+        for name, serializer in self.find_serializers(self.import_module(module_name)):
+            index.add_serializer(app_config, name, serializer)
+
+    def index_serializers_of(self, model):
+        # In partial runs, imports the modules that defined serializers of the
+        # model in the previous export, as recorded by the dependency graph,
+        # so relations resolve as in a full run. Without a graph, everything
+        # is indexed.
+        index = self.type_index()
+        if not self.partial or model in index.indexed_models:
+            return index
+        index.indexed_models.add(model)
+
+        if self.previous_nodes is None:
+            for app in self.apps:
+                self.index_app(index, self.get_app_config(app))
+            return index
+        for node in self.previous_nodes.values():
+            if node["app"] in self.apps and model._meta.label in node["models"]:
+                self.index_module(
+                    index, self.get_app_config(node["app"]), node["module"]
                 )
-            return (
-                related_serializer,
-                f'import {{ {related_serializer} }} from "{import_path}";',
+        return index
+
+    def serializer_label(self, serializer):
+        # App label of the app exporting the serializer, if any.
+        index = self.type_index()
+        if self.partial and serializer not in index.serializer_labels:
+            for app in self.apps:
+                app_config = self.get_app_config(app)
+                package = f"{app_config.name}.serializers"
+                module_name = serializer.__module__
+                if module_name == package or module_name.startswith(f"{package}."):
+                    self.index_module(index, app_config, module_name)
+        return index.serializer_labels.get(serializer)
+
+    def find_reachable(self):
+        # Serializers of the API views, then every exported serializer their
+        # interfaces reference, directly or transitively.
+        exported = self.type_index().serializers
+
+        with self.profiler.phase("reachability"):
+            pending = list(api_serializers())
+        reachable = set()
+        while pending:
+            serializer = pending.pop()
+            if serializer in reachable:
+                continue
+            reachable.add(serializer)
+            app_configs = [
+                app_config
+                for app_config, _, cls in exported.get(serializer.__name__, ())
+                if cls is serializer
+            ]
+            app_name = app_configs[0].name if app_configs else serializer.__module__
+            fields = self.resolve_serializer_fields(
+                serializer.__name__, serializer, app_name
+            )
+            for field in fields or ():
+                for node in walk(field.type):
+                    if isinstance(node, Reference):
+                        pending += self.referenced_serializers(node, exported)
+
+        return Reachable(
+            [
+                (app_config, name, serializer)
+                for candidates in exported.values()
+                for app_config, name, serializer in candidates
+                if serializer in reachable
+            ]
+        )
+
+    def get_serializer_models(self, serializer):
+        # The model of the serializer and of every serializer written inline.
+        models = set()
+        for serializer_class in [serializer] + self.introspection.nested(serializer):
+            model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+            if model is not None:
+                models.add(model)
+        return sorted(models, key=lambda model: model._meta.label)
+
+    def get_related_type(self, related_model, related_serializer):
+        return Reference(related_serializer, related_model._meta.app_label)
+
+    def get_model_serializer_type(self, related_model):
+        # The serializer exported for the model, whatever its name; models
+        # without one keep the <Model>Serializer name.
+        found = self.index_serializers_of(related_model).serializer_for(related_model)
+        if found is None:
+            return self.get_related_type(
+                related_model, related_model.__name__ + "Serializer"
             )
-        else:
-            return related_serializer, None
+        app_label, name = found
+        return Reference(name, app_label)
 
     def infer_serializer_method_field_type(self, field, serializer, field_name):
         method_name = field.method_name or f"get_{field_name}"
@@ -71,178 +236,153 @@ class SerializersExporter:
         if method is None:
             return "any"  # Unable to determine type if the method is not found
 
-        method_source = inspect.getsource(method)
-
-        signature = inspect.signature(method)
-        return_annotation = signature.return_annotation
-
-        if return_annotation is inspect.Signature.empty:
-            if "return" in method_source:
-                return_statements = [
-                    line.strip()
-                    for line in method_source.split("\n")
-                    if line.strip().startswith("return")
-                ]
-                if return_statements:
-                    return_statement = return_statements[-1]
-                    if "{" in return_statement and "}" in return_statement:
-                        return "{ [key: string]: any }"  # Infer as dictionary
-                    elif "[" in return_statement and "]" in return_statement:
-                        return "any[]"  # Infer as list
-                    elif '"' in return_statement or "'" in return_statement:
-                        return "string"
-                    elif return_statement.replace("return", "").strip().isdigit():
-                        return "number"
-                    elif "True" in return_statement or "False" in return_statement:
-                        return "boolean"
-                    else:
-                        return "any"
-            return "any"  # Default to 'any' if no type hint is provided
-
-        if return_annotation is int:
-            return "number"
-        elif return_annotation is str:
-            return "string"
-        elif return_annotation is bool:
-            return "boolean"
-        elif return_annotation is float:
-            return "number"
-        elif return_annotation is list:
-            return (
-                "any[]"  # More specific type inference for lists can be added if needed
+        with self.profiler.phase("inference"):
+            return infer_return_type(method)
+
+    def get_ts_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        handler = self.field_types.lookup(type(field))
+        if handler is None:
+            return "any"
+        if isinstance(handler, str):
+            return handler
+        return from_handler_result(
+            handler(
+                self, field, field_name, app_name, serializer_name, original_serializer
             )
-        elif return_annotation is dict:
-            return "{ [key: string]: any }"  # More specific type inference for dicts can be added if needed
+        )
 
-        if isinstance(return_annotation, type):
-            return return_annotation.__name__
+    def get_choice_field_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        return self.handle_field_with_choices(field, field_name, serializer_name)
 
-        return "any"
+    def get_primary_key_related_field_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        return self.get_model_serializer_type(field.queryset.model)
 
-    def get_ts_type(
+    def get_many_related_field_type(
         self, field, field_name, app_name, serializer_name, original_serializer=None
     ):
-        if isinstance(field, serializers.CharField):
-            return "string", None
-        elif isinstance(field, serializers.IntegerField):
-            return "number", None
-        elif isinstance(field, serializers.BooleanField):
-            return "boolean", None
-        elif isinstance(field, serializers.DateTimeField):
-            return "string", None  # DateTimeField can be represented as ISO 8601 string
-        elif isinstance(field, serializers.DateField):
-            return "string", None  # DateField can be represented as ISO 8601 string
-        elif isinstance(field, serializers.DecimalField):
-            return "number", None  # DecimalField can be represented as number
-        elif isinstance(field, serializers.ChoiceField):
-            ts_type, enum_definition = self.handle_field_with_choices(
-                field, field_name, serializer_name
-            )
-            return ts_type, enum_definition
-        elif isinstance(field, serializers.PrimaryKeyRelatedField):
-            related_model = field.queryset.model
-            related_serializer = related_model.__name__ + "Serializer"
-            return self.get_related_type_and_import(
-                related_model, related_serializer, app_name, serializer_name
-            )
-        elif isinstance(field, serializers.ManyRelatedField):
-            related_model = field.child_relation.queryset.model
-            related_serializer = related_model.__name__ + "Serializer"
-            ts_type, import_statement = self.get_related_type_and_import(
-                related_model, related_serializer, app_name, serializer_name
-            )
-            return f"{ts_type}[]", import_statement
-        elif isinstance(field, serializers.FileField):
-            return "File", None
-        elif isinstance(field, serializers.ListSerializer):
-            child_serializer = field.child
-            related_serializer = child_serializer.__class__.__name__
-            ts_type, import_statement = self.get_related_type_and_import(
-                child_serializer.Meta.model,
-                related_serializer,
-                app_name,
-                serializer_name,
-            )
-            return f"{ts_type}[]", import_statement
-        elif isinstance(field, serializers.SerializerMethodField):
-            inferred_type = self.infer_serializer_method_field_type(
-                field, original_serializer, field_name
-            )
-            return inferred_type, None
-        elif isinstance(field, serializers.UUIDField):
-            return "string", None  # UUIDField can be represented as string
-        elif isinstance(field, serializers.JSONField):
-            return (
-                "{ [key: string]: any }",
-                None,
-            )  # JSONField can be represented as dictionary
-        elif issubclass(type(field), serializers.ModelSerializer):
-            nested_serializer = field.__class__.__name__
-            return self.get_related_type_and_import(
-                field.Meta.model, nested_serializer, app_name, serializer_name
-            )
-        return "any", None
+        return Array(
+            self.get_model_serializer_type(field.child_relation.queryset.model)
+        )
 
-    def handle_field_with_choices(self, field, field_name, serializer_name):
-        enum_name = f"{serializer_name}{field_name.capitalize()}Enum"
-        choices = field.choices
-        enum_definition = f"export enum {enum_name} {{\n"
-        for value, label in choices.items():
-            enum_definition += (
-                f"  {label.replace(' ', '_').replace('�', 'í')} = '{value}',\n"
+    def get_list_serializer_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        return Array(
+            self.get_nested_serializer_type(
+                field.child, field_name, app_name, serializer_name
             )
-        enum_definition += "}\n"
-        return enum_name, enum_definition
+        )
 
-    def convert_serializer_to_ts_interface(self, name, serializer, app_name):
-        fields = serializer().get_fields()
-        ts_fields = []
-        imports = set()
-        enums = set()
-
-        for field_name, field in fields.items():
-            ts_type, enum_definition = self.get_ts_type(
-                field, field_name, app_name, name, original_serializer=serializer
-            )
-            ts_fields.append(f"{field_name}: {ts_type};")
+    def get_nested_serializer_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        nested_class = field.__class__
+        if self.is_exported_serializer(nested_class):
+            # Written by the app exporting it, which may not be the model's.
+            app_label = self.serializer_label(nested_class)
+            if app_label is None:
+                return self.get_related_type(field.Meta.model, nested_class.__name__)
+            return Reference(nested_class.__name__, app_label)
+        return self.get_inline_serializer_type(nested_class, app_name)
+
+    def is_exported_serializer(self, serializer_class):
+        return (
+            issubclass(serializer_class, serializers.ModelSerializer)
+            and serializer_class.__qualname__ == serializer_class.__name__
+        )
+
+    def get_inline_serializer_type(self, serializer_class, app_name):
+        # Serializers without an interface of their own (DRF's depth-generated
+        # NestedSerializer, plain Serializers) are written inline.
+        model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+        name = f"{model.__name__}Nested" if model else serializer_class.__name__
+        fields = self.resolve_serializer_fields(name, serializer_class, app_name)
+        if fields is None:
+            # The serializer is being resolved further up: a cycle.
+            self.diagnostics.cycle(self.introspection.cycles[-1])
+            return "any"
+        return InlineObject(fields)
 
-            if ts_type == "any":
-                self.any_fields_log.append(f"{app_name}.{name}.{field_name}")
-            if enum_definition:
-                if "export enum" in enum_definition:
-                    enums.add(enum_definition)
-                elif enum_definition:
-                    imports.add(enum_definition)
+    def get_method_field_type(
+        self, field, field_name, app_name, serializer_name, original_serializer=None
+    ):
+        return self.infer_serializer_method_field_type(
+            field, original_serializer, field_name
+        )
 
-        import_statements = "\n".join(sorted(imports))
-        enum_statements = "\n".join(sorted(enums))
+    def handle_field_with_choices(self, field, field_name, serializer_name):
+        return choices_enum(
+            f"{serializer_name}{field_name.capitalize()}Enum", field.choices.items()
+        )
 
-        interface = (
-            f"export interface {name} {{\n  " + "\n  ".join(ts_fields) + "\n}\n\n"
+    def resolve_serializer_fields(self, name, serializer, app_name):
+        return self.introspection.resolve(
+            serializer,
+            lambda: self.get_serializer_fields(name, serializer, app_name),
         )
 
-        result = ""
+    def get_serializer_fields(self, name, serializer, app_name):
+        with self.profiler.phase("introspection"):
+            fields = self.introspection.get_fields(serializer)
+        return tuple(
+            Field(
+                field_name,
+                self.get_ts_type(
+                    field, field_name, app_name, name, original_serializer=serializer
+                ),
+            )
+            for field_name, field in fields.items()
+        )
 
-        if import_statements:
-            result = f"{import_statements}\n\n"
+    def build_serializer_interface(self, name, serializer, app_config):
+        fields = self.resolve_serializer_fields(name, serializer, app_config.name)
+        for field in fields:
+            if field.type == "any":
+                self.diagnostics.any_field(f"{app_config.name}.{name}.{field.name}")
 
-        if enum_statements:
-            result = result + f"{enum_statements}\n\n"
+        models = self.get_serializer_models(serializer)
+        return Interface(
+            app_config.name,
+            app_config.label,
+            name,
+            fields,
+            serializer.__module__,
+            tuple(model._meta.label for model in models),
+            self.graph_sources(serializer, *models),
+        )
 
-        if interface:
-            result = result + f"{interface}"
+    def convert_serializer_to_ts_interface(self, name, serializer, app_name):
+        interface = self.build_serializer_interface(
+            name, serializer, self.get_app_config(app_name)
+        )
+        return self.emitter.interface(interface), interface.references
 
-        return result, list(imports)
 
-    def write_interface(self, app_outdir, name, ts_interface, imports):
-        interface_path = os.path.join(app_outdir, f"{name}.ts")
-        with open(interface_path, "w", encoding="utf-8") as f:
-            f.write(ts_interface)
+DEFAULT_FIELD_TYPES = {
+    serializers.CharField: "string",
+    serializers.IntegerField: "number",
+    serializers.BooleanField: "boolean",
+    serializers.DateTimeField: "string",  # ISO 8601 string
+    serializers.DateField: "string",  # ISO 8601 string
+    serializers.DecimalField: "number",
+    serializers.UUIDField: "string",
+    serializers.JSONField: "{ [key: string]: any }",
+    serializers.FileField: "File",
+    serializers.ChoiceField: SerializersExporter.get_choice_field_type,
+    serializers.PrimaryKeyRelatedField: (
+        SerializersExporter.get_primary_key_related_field_type
+    ),
+    serializers.ManyRelatedField: SerializersExporter.get_many_related_field_type,
+    serializers.ListSerializer: SerializersExporter.get_list_serializer_type,
+    serializers.Serializer: SerializersExporter.get_nested_serializer_type,
+    serializers.SerializerMethodField: SerializersExporter.get_method_field_type,
+}
 
-    def log_any_fields(self):
-        if self.any_fields_log:
-            print("\nFields with 'any' type detected:")
-            for field in self.any_fields_log:
-                print(field)
-        else:
-            print("\nNo fields with 'any' type detected.")
+for field_class, handler in DEFAULT_FIELD_TYPES.items():
+    serializer_field_types.register_default(field_class, handler)
@@ -0,0 +1,139 @@
+import io
+import os
+import sys
+import time
+import tarfile
+import zipfile
+from collections import namedtuple
+from .manifest import Manifest
+from .utils import create_directory, write_file
+
+
+class FileSystemSink:
+    def __init__(self, outdir, incremental=False):
+        self.outdir = outdir
+        self.manifest = Manifest(outdir) if incremental else None
+
+    def write(self, relpath, content):
+        if self.manifest:
+            self.manifest.write(relpath, content)
+        else:
+            path = os.path.join(self.outdir, relpath)
+            create_directory(os.path.dirname(path))
+            write_file(path, content)
+
+    def close(self):
+        if self.manifest:
+            self.manifest.prune()
+            self.manifest.save()
+
+
+class MemorySink:
+    def __init__(self):
+        self.files = {}
+
+    def write(self, relpath, content):
+        self.files[relpath] = content
+
+    def close(self):
+        return self.files
+
+
+# Relative paths of generated files that differ from the output directory.
+Drift = namedtuple("Drift", ["changed", "added", "removed"])
+
+
+class CheckSink(MemorySink):
+    """Compares the generated files with the output directory, without writing.
+
+    Hidden files, such as the manifest and the dependency graph, are not
+    generated content and are left out of the comparison.
+    """
+
+    def __init__(self, outdir):
+        super().__init__()
+        self.outdir = outdir
+
+    def existing_files(self):
+        relpaths = set()
+        for root, dirs, files in os.walk(self.outdir):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for file in files:
+                if not file.startswith("."):
+                    path = os.path.relpath(os.path.join(root, file), self.outdir)
+                    relpaths.add(path.replace(os.sep, "/"))
+        return relpaths
+
+    def differs(self, relpath, content):
+        try:
+            with open(os.path.join(self.outdir, relpath), "r", encoding="utf-8") as f:
+                return f.read() != content
+        except (OSError, UnicodeDecodeError):
+            return True
+
+    def close(self):
+        existing = self.existing_files()
+        return Drift(
+            sorted(
+                relpath
+                for relpath, content in self.files.items()
+                if relpath in existing and self.differs(relpath, content)
+            ),
+            sorted(set(self.files) - existing),
+            sorted(existing - set(self.files)),
+        )
+
+
+class SubtreeSink:
+    # Writes into a directory of a sink shared with other exporters, which
+    # closes it once all of them are done.
+    def __init__(self, sink, prefix):
+        self.sink = sink
+        self.prefix = prefix
+
+    def write(self, relpath, content):
+        self.sink.write(f"{self.prefix}/{relpath}", content)
+
+    def close(self):
+        pass
+
+
+class StdoutSink:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def write(self, relpath, content):
+        self.stream.write(f"// {relpath}\n{content}")
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class ArchiveSink:
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            create_directory(os.path.dirname(path))
+        if path.endswith(".zip"):
+            self.archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        elif path.endswith((".tar.gz", ".tgz")):
+            # "w|gz" writes a stream without seeking back, member by member.
+            self.archive = tarfile.open(path, "w|gz")
+        else:
+            raise ValueError(
+                f"Unsupported archive format: {path}. Use .tar.gz, .tgz or .zip."
+            )
+
+    def write(self, relpath, content):
+        data = content.encode("utf-8")
+        if isinstance(self.archive, zipfile.ZipFile):
+            self.archive.writestr(relpath, data)
+        else:
+            info = tarfile.TarInfo(relpath)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.archive.close()
@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+import importlib.util
+from . import __version__
+from .utils import create_directory, write_file
+
+STAMP_FILENAME = ".ts-exporter-stamp.json"
+# Upgrading these rewrites their files, which changes the fingerprint.
+PACKAGES = ("django", "rest_framework")
+# Directories of a project that never hold its apps.
+IGNORED_DIRS = {"__pycache__", "node_modules", "site-packages"}
+
+
+def fingerprint(entries):
+    digest = hashlib.sha256()
+    for entry in sorted(entries):
+        digest.update(repr(entry).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def stat_entry(path):
+    stat = os.stat(path)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def module_file(name):
+    # Does not import the module, only the packages containing it.
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec and spec.origin and os.path.exists(spec.origin):
+        return spec.origin
+    return None
+
+
+def is_virtualenv(path):
+    return os.path.exists(os.path.join(path, "pyvenv.cfg"))
+
+
+class Stamp:
+    """What the last export was built from, checked before Django is set up.
+
+    Sources are the Python files of the project (a superset of the local apps,
+    which are only known once the settings are loaded), the settings module
+    and the installed Django, DRF and exporter itself. Everything is compared by size
+    and mtime, without reading files.
+    """
+
+    def __init__(self, outdir, project_root, settings_module, options):
+        self.outdir = outdir
+        self.path = os.path.join(outdir, STAMP_FILENAME)
+        self.project_root = str(project_root)
+        self.settings_module = settings_module
+        self.options = options
+        # Taken before exporting, so changes made meanwhile trigger a new export.
+        self.sources = self.sources_fingerprint()
+
+    def sources_fingerprint(self):
+        outdir = os.path.realpath(self.outdir)
+        entries = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [
+                d
+                for d in dirs
+                if not d.startswith(".")
+                and d not in IGNORED_DIRS
+                and os.path.realpath(os.path.join(root, d)) != outdir
+                and not is_virtualenv(os.path.join(root, d))
+            ]
+            for file in files:
+                if file.endswith(".py"):
+                    try:
+                        entries.append(stat_entry(os.path.join(root, file)))
+                    except OSError:
+                        continue
+
+        for name in filter(None, (self.settings_module,) + PACKAGES):
+            path = module_file(name)
+            if path:
+                entries.append(stat_entry(path))
+
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for file in os.listdir(package_dir):
+            if file.endswith(".py"):
+                entries.append(stat_entry(os.path.join(package_dir, file)))
+        return fingerprint(entries)
+
+    def outputs_fingerprint(self):
+        # Generated files edited or removed by hand are exported again.
+        entries = []
+        for root, _, files in os.walk(self.outdir):
+            for file in files:
+                path = os.path.join(root, file)
+                if path != self.path:
+                    entries.append(stat_entry(path))
+        return fingerprint(entries)
+
+    def data(self):
+        return {
+            "version": __version__,
+            "options": self.options,
+            "sources": self.sources,
+        }
+
+    def is_current(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return False
+        outputs = stamp.pop("outputs", None)
+        return stamp == self.data() and outputs == self.outputs_fingerprint()
+
+    def save(self):
+        create_directory(self.outdir)
+        data = dict(self.data(), outputs=self.outputs_fingerprint())
+        write_file(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
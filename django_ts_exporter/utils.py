@@ -7,5 +7,5 @@ def create_directory(path):
 
 
 def write_file(path, content):
-    with open(path, "w") as file:
+    with open(path, "w", encoding="utf-8") as file:
         file.write(content)
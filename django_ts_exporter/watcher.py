@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+import types
+import warnings
+import importlib
+
+SOURCE_PACKAGES = ("models", "serializers")
+IGNORED_DIRS = {"__pycache__", "migrations"}
+
+
+def clear_module(module):
+    # reload() runs the new source in the namespace of the old module, which
+    # would keep the classes the source no longer defines. Submodules bound on
+    # a package stay, they are reloaded on their own.
+    prefix = f"{module.__name__}."
+    for name, value in list(vars(module).items()):
+        if name.startswith("__"):
+            continue
+        if isinstance(value, types.ModuleType) and value.__name__.startswith(prefix):
+            continue
+        delattr(module, name)
+
+
+class Watcher:
+    def __init__(self, exporter, interval=0.5, enable_logs=False):
+        self.exporter = exporter
+        self.interval = interval
+        self.enable_logs = enable_logs
+        self.app_configs = {app: exporter.get_app_config(app) for app in exporter.apps}
+        self.mtimes = self.snapshot()
+
+    def snapshot(self):
+        mtimes = {}
+        for app, app_config in self.app_configs.items():
+            for root, dirs, files in os.walk(app_config.path):
+                dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+                for file in files:
+                    if file.endswith(".py"):
+                        path = os.path.join(root, file)
+                        try:
+                            mtimes[path] = (app, os.stat(path).st_mtime_ns)
+                        except OSError:
+                            continue
+        return mtimes
+
+    def poll(self):
+        mtimes = self.snapshot()
+        changed = {}
+        for path in set(mtimes) | set(self.mtimes):
+            if mtimes.get(path) != self.mtimes.get(path):
+                app = (mtimes.get(path) or self.mtimes.get(path))[0]
+                changed.setdefault(app, []).append(path)
+        self.mtimes = mtimes
+        return changed
+
+    def module_name(self, app_config, path):
+        relpath = os.path.relpath(path, app_config.path)[:-3]
+        parts = relpath.split(os.sep)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join([app_config.name] + parts)
+
+    def app_modules(self, app_config, package):
+        prefix = f"{app_config.name}.{package}"
+        names = [
+            name
+            for name in sys.modules
+            if name == prefix or name.startswith(f"{prefix}.")
+        ]
+        # Submodules first, so a package __init__ picks up the fresh classes.
+        return sorted(names, key=lambda name: (-name.count("."), name))
+
+    def reload_app(self, app, paths):
+        app_config = self.app_configs[app]
+        changed = [self.module_name(app_config, path) for path in paths]
+        models_changed = any(
+            name == f"{app_config.name}.models"
+            or name.startswith(f"{app_config.name}.models.")
+            for name in changed
+        )
+
+        to_reload = [
+            name
+            for name in changed
+            if name in sys.modules
+            and not name.startswith(
+                tuple(f"{app_config.name}.{package}" for package in SOURCE_PACKAGES)
+            )
+        ]
+        if models_changed:
+            to_reload += self.app_modules(app_config, "models")
+        to_reload += self.app_modules(app_config, "serializers")
+
+        with warnings.catch_warnings():
+            # Django warns when a model class is registered twice; that is
+            # exactly what reloading a models module does.
+            warnings.filterwarnings("ignore", message=".*was already registered.*")
+            for name in to_reload:
+                module = sys.modules[name]
+                clear_module(module)
+                importlib.reload(module)
+
+        if models_changed:
+            app_config.apps.clear_cache()
+        return to_reload
+
+    def refresh(self, changed):
+        for app in [app for app in self.exporter.apps if app in changed]:
+            started = time.perf_counter()
+            try:
+                reloaded = self.reload_app(app, changed[app])
+                if self.enable_logs:
+                    print(f"Reloaded {', '.join(reloaded)}")
+                self.exporter.refresh_app(app)
+            except Exception as e:
+                print(f"Error while exporting {app}: {e}")
+                continue
+
+            elapsed = time.perf_counter() - started
+            print(f"Exported {app} in {elapsed:.2f}s")
+            self.exporter.diagnostics.close()
+
+    def run(self):
+        print(
+            f"Watching {len(self.app_configs)} apps for changes. Press Ctrl+C to stop."
+        )
+        try:
+            while True:
+                time.sleep(self.interval)
+                changed = self.poll()
+                if changed:
+                    self.refresh(changed)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
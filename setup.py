@@ -5,7 +5,7 @@ setup(
     version="0.4.0",
     packages=find_packages(),
     include_package_data=True,
-    install_requires=["Django>=3.0", "djangorestframework>=3.11"],
+    install_requires=["Django>=3.2", "djangorestframework>=3.11"],
     entry_points={
         "console_scripts": [
             "django-ts-exporter=django_ts_exporter.exporter:main",
@@ -23,5 +23,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
 )
@@ -28,3 +28,31 @@ class TestModel(models.Model):
 
     class Meta:
         app_label = "tests"
+
+
+class ProxyTestModel(TestModel):
+    class Meta:
+        app_label = "tests"
+        proxy = True
+
+
+class UnmanagedModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+class Status(models.TextChoices):
+    DRAFT = "draft", "Draft"
+    PUBLISHED = "published", "Published"
+
+
+class Article(models.Model):
+    status = models.CharField(max_length=20, choices=Status.choices)
+    review_status = models.CharField(max_length=20, choices=Status.choices)
+    priority = models.IntegerField(choices=[(1, "Low"), (2, "High")])
+
+    class Meta:
+        app_label = "tests"
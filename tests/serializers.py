@@ -1,5 +1,8 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
 from rest_framework import serializers
-from .models import TestModel, RelatedModel
+from .models import Article, TestModel, RelatedModel
 
 
 class RelatedModelSerializer(serializers.ModelSerializer):
@@ -12,3 +15,75 @@ class TestModelSerializer(serializers.ModelSerializer):
     class Meta:
         model = TestModel
         fields = "__all__"
+
+
+class TestModelDepthSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TestModel
+        fields = ["id", "foreign_key", "one_to_one"]
+        depth = 1
+
+
+class SummarySerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    label = serializers.CharField()
+
+
+class TestModelSummarySerializer(serializers.ModelSerializer):
+    summary = SummarySerializer(source="*")
+    history = SummarySerializer(many=True, source="*")
+    related = RelatedModelSerializer(source="foreign_key")
+
+    class Meta:
+        model = TestModel
+        fields = ["id", "summary", "history", "related"]
+
+
+class TestModelMethodSerializer(serializers.ModelSerializer):
+    tags = serializers.SerializerMethodField()
+    nickname = serializers.SerializerMethodField()
+    scores = serializers.SerializerMethodField()
+    is_recent = serializers.SerializerMethodField()
+    summary = serializers.SerializerMethodField()
+    status = serializers.SerializerMethodField()
+    unknown = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TestModel
+        fields = ["id", "tags", "nickname", "scores", "is_recent", "summary"]
+        fields += ["status", "unknown"]
+
+    def get_tags(self, obj) -> list[int]:
+        return []
+
+    def get_nickname(self, obj) -> Optional[str]:
+        return None
+
+    def get_scores(self, obj) -> Dict[str, float]:
+        return {}
+
+    def get_is_recent(self, obj):
+        return obj.integer_field > 10
+
+    def get_summary(self, obj):
+        if obj.boolean_field:
+            return {"label": obj.char_field}
+        return None
+
+    def get_status(self, obj):
+        return "active" if obj.boolean_field else "inactive"
+
+    def get_unknown(self, obj):
+        return obj.char_field
+
+
+class ArticleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = "__all__"
+
+
+class ArticleSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ["status", "priority"]
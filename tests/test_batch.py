@@ -0,0 +1,173 @@
+import io
+import os
+import json
+import tempfile
+import unittest
+from types import SimpleNamespace
+from django_ts_exporter.batch import (
+    BatchProject,
+    BatchResult,
+    batch_exit_status,
+    forwarded_arguments,
+    load_batch,
+    print_summary,
+    project_command,
+    run_batch,
+)
+from django_ts_exporter.exporter import validate_batch_arguments
+
+SETTINGS = """
+import os
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECRET_KEY = "batch"
+INSTALLED_APPS = ["django.contrib.contenttypes", "django.contrib.auth"]
+"""
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, relpath, content):
+        path = os.path.join(self.root, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def write_config(self, data):
+        return self.write("batch.json", json.dumps(data))
+
+    def result(self, returncode):
+        project = BatchProject("shop", self.root, None, "out", [])
+        return BatchResult(project, returncode, "", 0.1)
+
+    def test_load_batch(self):
+        config = self.write_config(
+            {
+                "projects": [
+                    {"root": "services/shop", "outdir": "frontend/shop"},
+                    {
+                        "settings": "billing.settings",
+                        "outdir": "frontend/billing",
+                        "args": ["--source", "models"],
+                    },
+                ]
+            }
+        )
+        shop, billing = load_batch(config)
+
+        self.assertEqual(shop.name, "shop")
+        self.assertEqual(shop.root, os.path.join(self.root, "services", "shop"))
+        self.assertEqual(shop.outdir, os.path.join(self.root, "frontend", "shop"))
+        self.assertIsNone(shop.settings)
+        self.assertEqual(billing.name, "billing.settings")
+        self.assertEqual(billing.root, self.root)
+        self.assertEqual(billing.args, ["--source", "models"])
+
+    def test_invalid_batch(self):
+        for data in ([], {"projects": [{"root": "shop"}]}, [{"outdir": "out"}]):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                load_batch(self.write_config(data))
+
+    def test_forwarded_arguments(self):
+        self.assertEqual(
+            forwarded_arguments(["--batch", "batch.json", "-s", "models"]),
+            ["-s", "models"],
+        )
+        self.assertEqual(
+            forwarded_arguments(["--check", "--batch=batch.json"]), ["--check"]
+        )
+
+    def test_forwarded_paths_are_absolute(self):
+        # Projects run from their own root, not from where the batch runs.
+        self.assertEqual(
+            forwarded_arguments(
+                ["--changed-files", "shop/models.py", "/srv/a.py", "-s", "models"],
+                cwd="/repo",
+            ),
+            ["--changed-files", "/repo/shop/models.py", "/srv/a.py", "-s", "models"],
+        )
+        self.assertEqual(
+            forwarded_arguments(["--changed-files=shop/models.py"], cwd="/repo"),
+            ["--changed-files=/repo/shop/models.py"],
+        )
+
+    def test_profile_files_are_rejected(self):
+        def error(**options):
+            defaults = dict(
+                batch="batch.json",
+                stdout=False,
+                archive=None,
+                watch=False,
+                ts_settings=None,
+                profile=None,
+                profile_dump=None,
+            )
+            return validate_batch_arguments(
+                SimpleNamespace(**dict(defaults, **options))
+            )
+
+        self.assertIsNone(error())
+        self.assertIsNone(error(profile=""))
+        self.assertIsNotNone(error(profile="report.json"))
+        self.assertIsNotNone(error(profile_dump="export.prof"))
+
+    def test_project_command(self):
+        project = BatchProject("shop", self.root, "shop.settings", "out", ["-i"])
+        command = project_command(project, ["-s", "models"])
+
+        self.assertEqual(
+            command[3:],
+            ["-s", "models", "-i", "--outdir", "out", "--yes"]
+            + ["--settings", "shop.settings"],
+        )
+
+    def test_exit_status(self):
+        self.assertEqual(batch_exit_status([self.result(0), self.result(0)]), 0)
+        self.assertEqual(batch_exit_status([self.result(0), self.result(1)]), 1)
+        self.assertEqual(batch_exit_status([self.result(1), self.result(2)]), 2)
+
+    def test_summary(self):
+        output = io.StringIO()
+        print_summary([self.result(0), self.result(1), self.result(2)], 1.5, output)
+
+        self.assertIn("Batch of 3 project(s) done in 1.50s:", output.getvalue())
+        self.assertIn("out of date", output.getvalue())
+        self.assertIn("failed (2)", output.getvalue())
+
+    def test_run_batch(self):
+        # One project found through manage.py, one through its settings only.
+        self.write(
+            "shop/manage.py",
+            'os.environ.setdefault("DJANGO_SETTINGS_MODULE", "shop_site.settings")\n',
+        )
+        self.write("shop/shop_site/__init__.py", "")
+        self.write("shop/shop_site/settings.py", SETTINGS)
+        self.write("billing/conf/__init__.py", "")
+        self.write("billing/conf/prod.py", SETTINGS)
+        config = self.write_config(
+            [
+                {"root": "shop", "outdir": "out/shop"},
+                {"root": "billing", "settings": "conf.prod", "outdir": "out/billing"},
+            ]
+        )
+
+        results = run_batch(
+            load_batch(config), ["-s", "models", "--include", "django.contrib.auth"]
+        )
+
+        self.assertEqual([result.returncode for result in results], [0, 0])
+        for project in ("shop", "billing"):
+            path = os.path.join(
+                self.root, "out", project, "django.contrib.auth", "User.ts"
+            )
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.base_exporter import Import, RenderedInterface
+from django_ts_exporter.bundler import Bundler
+from django_ts_exporter.models_exporter import ModelsExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+APPS = ["django.contrib.contenttypes", "django.contrib.auth", "tests"]
+
+
+class BundlerTestCase(TestCase):
+    def export(self, bundle):
+        with tempfile.TemporaryDirectory() as outdir:
+            ModelsExporter(
+                outdir=outdir, apps=APPS, enable_logs=False, bundle=bundle
+            ).export()
+            tree = {}
+            for file in os.listdir(outdir):
+                with open(os.path.join(outdir, file), encoding="utf-8") as f:
+                    tree[file] = f.read()
+            return tree
+
+    def test_app_bundles(self):
+        tree = self.export("app")
+        self.assertEqual(sorted(tree), ["auth.ts", "contenttypes.ts", "tests.ts"])
+
+        self.assertTrue(
+            tree["auth.ts"].startswith(
+                'import { ContentType } from "./contenttypes.ts";\n\n'
+            )
+        )
+        self.assertIn("export interface Permission {", tree["auth.ts"])
+        self.assertIn("export interface User {", tree["auth.ts"])
+
+        self.assertNotIn("import", tree["tests.ts"])
+        self.assertIn("export interface RelatedModel {", tree["tests.ts"])
+        self.assertIn("foreign_key: RelatedModel;", tree["tests.ts"])
+
+    def test_single_bundle(self):
+        tree = self.export("single")
+        self.assertEqual(list(tree), ["index.ts"])
+        self.assertNotIn("import", tree["index.ts"])
+        self.assertIn("export interface ContentType {", tree["index.ts"])
+        self.assertIn("export interface TestModel {", tree["index.ts"])
+
+    def test_imports_are_merged_per_bundle(self):
+        interfaces = [
+            RenderedInterface(
+                "orders",
+                "orders",
+                "Order",
+                "export interface Order {}\n\n",
+                [Import("Customer", "crm"), Import("Item", "orders")],
+            ),
+            RenderedInterface(
+                "orders",
+                "orders",
+                "Refund",
+                "export interface Refund {}\n\n",
+                [Import("Address", "crm"), Import("Order", "orders")],
+            ),
+        ]
+        [(relpath, content)] = Bundler("app").render(interfaces)
+
+        self.assertEqual(relpath, "orders.ts")
+        self.assertEqual(
+            content,
+            'import { Address, Customer } from "./crm.ts";\n\n'
+            "export interface Order {}\n\n"
+            "export interface Refund {}\n\n",
+        )
+
+    def test_single_bundle_rejects_duplicate_names(self):
+        interfaces = [
+            RenderedInterface("crm", "crm", "User", "", []),
+            RenderedInterface("shop", "shop", "User", "", []),
+        ]
+        with self.assertRaises(RuntimeError):
+            list(Bundler("single").render(interfaces))
+
+
+if __name__ == "__main__":
+    unittest.main()
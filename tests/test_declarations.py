@@ -0,0 +1,95 @@
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.emitter import TypeScriptEmitter
+from django_ts_exporter.schema import Enum
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+STATUS = Enum("StatusEnum", (("Draft", "draft"), ("Published", "published")))
+
+
+class DeclarationsTestCase(TestCase):
+    def export(self, **kwargs):
+        return SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            declarations=True,
+            **kwargs,
+        ).export()
+
+    def test_enum_styles(self):
+        self.assertEqual(
+            TypeScriptEmitter().enum(STATUS),
+            "export enum StatusEnum {\n"
+            "  Draft = 'draft',\n  Published = 'published',\n}\n",
+        )
+        self.assertEqual(
+            TypeScriptEmitter("const").enum(STATUS),
+            "export const enum StatusEnum {\n"
+            "  Draft = 'draft',\n  Published = 'published',\n}\n",
+        )
+        self.assertEqual(
+            TypeScriptEmitter("union").enum(STATUS),
+            "export type StatusEnum = 'draft' | 'published';\n",
+        )
+        with self.assertRaises(ValueError):
+            TypeScriptEmitter("enum", declarations=True)
+
+    def test_declaration_files(self):
+        files = self.export()
+
+        self.assertTrue(all(relpath.endswith(".d.ts") for relpath in files))
+        summary = files["tests/TestModelSummarySerializer.d.ts"]
+        self.assertIn(
+            'import type { RelatedModelSerializer } from "./RelatedModelSerializer";',
+            summary,
+        )
+        self.assertIn(
+            "export const enum ArticleSerializerStatusEnum {",
+            files["tests/ArticleSerializer.d.ts"],
+        )
+
+    def test_union_enums(self):
+        files = self.export(enum_style="union", shared_enums=True)
+
+        self.assertEqual(
+            files["enums/StatusEnum.d.ts"],
+            "export type StatusEnum = 'draft' | 'published';\n",
+        )
+        self.assertIn(
+            'import type { StatusEnum } from "../enums/StatusEnum";',
+            files["tests/ArticleSerializer.d.ts"],
+        )
+
+    def test_bundles(self):
+        files = self.export(bundle="app", shared_enums=True)
+
+        self.assertEqual(sorted(files), ["enums.d.ts", "tests.d.ts"])
+        self.assertIn('from "./enums";', files["tests.d.ts"])
+        self.assertIn("import type", files["tests.d.ts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
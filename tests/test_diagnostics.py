@@ -0,0 +1,110 @@
+import io
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.diagnostics import Diagnostics
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class RecordingSink(MemorySink):
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def write(self, relpath, content):
+        self.events.append(("write", relpath))
+        super().write(relpath, content)
+
+
+class StreamingTestCase(TestCase):
+    def test_diagnostics_are_streamed(self):
+        stream = io.StringIO()
+        diagnostics = Diagnostics(stream)
+        exporter = SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            diagnostics=diagnostics,
+        )
+        interfaces = exporter.iter_app("tests")
+        while "unknown" not in stream.getvalue():
+            next(interfaces)
+
+        self.assertEqual(
+            stream.getvalue(),
+            "\nFields with 'any' type detected:\n"
+            "tests.TestModelMethodSerializer.unknown\n",
+        )
+        diagnostics.close()
+        self.assertEqual(diagnostics.count, 0)
+
+    def test_no_any_fields(self):
+        stream = io.StringIO()
+        Diagnostics(stream).close()
+
+        self.assertEqual(stream.getvalue(), "\nNo fields with 'any' type detected.\n")
+
+    def test_cycles(self):
+        stream = io.StringIO()
+        Diagnostics(stream).cycle(
+            ["OrderSerializer", "LineSerializer", "OrderSerializer"]
+        )
+
+        self.assertEqual(
+            stream.getvalue(),
+            "Cyclic serializer reference typed 'any': "
+            "OrderSerializer -> LineSerializer -> OrderSerializer\n",
+        )
+
+    def test_interfaces_are_written_as_they_are_built(self):
+        events = []
+        exporter = ModelsExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=RecordingSink(events),
+        )
+        build_model_interface = exporter.build_model_interface
+
+        def build(name, model, app_config):
+            events.append(("build", name))
+            return build_model_interface(name, model, app_config)
+
+        exporter.build_model_interface = build
+        exporter.export()
+
+        self.assertEqual(
+            events[:4],
+            [
+                ("build", "Article"),
+                ("write", "tests/Article.ts"),
+                ("build", "ProxyTestModel"),
+                ("write", "tests/ProxyTestModel.ts"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
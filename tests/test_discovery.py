@@ -0,0 +1,149 @@
+import os
+import tempfile
+import textwrap
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.discovery import ModuleScanner
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class ModuleScannerTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.scanner = ModuleScanner("Serializer", ("django", "rest_framework"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def needs_import(self, source):
+        path = os.path.join(self.tmpdir.name, "module.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(textwrap.dedent(source))
+        return self.scanner.needs_import(path)
+
+    def test_serializer_bases(self):
+        self.assertTrue(self.needs_import("""
+                from rest_framework import serializers
+
+                class OrderSerializer(serializers.ModelSerializer):
+                    pass
+                """))
+        self.assertTrue(self.needs_import("""
+                from .base import BaseOrderSerializer
+
+                class OrderSerializer(BaseOrderSerializer):
+                    pass
+                """))
+
+    def test_local_inheritance(self):
+        self.assertTrue(self.needs_import("""
+                from rest_framework.serializers import ModelSerializer as Base
+
+                class Intermediate(Base):
+                    pass
+
+                class Order(Intermediate):
+                    pass
+                """))
+
+    def test_modules_without_serializers_are_skipped(self):
+        self.assertFalse(self.needs_import("""
+                import enum
+                from rest_framework import serializers
+
+                class Status(enum.Enum):
+                    OPEN = "open"
+
+                class Helper:
+                    pass
+
+                class CurrencyField(serializers.DecimalField):
+                    pass
+                """))
+
+    def test_unresolvable_bases_fall_back_to_import(self):
+        self.assertTrue(self.needs_import("""
+                from .mixins import TimestampMixin
+
+                class Audit(TimestampMixin):
+                    pass
+                """))
+        self.assertTrue(self.needs_import("class Broken(:\n"))
+
+    def test_classes_in_compound_statements(self):
+        self.assertTrue(self.needs_import("""
+                from django.conf import settings
+
+                try:
+                    from rest_framework import serializers
+                except ImportError:
+                    serializers = None
+                else:
+                    class OrderSerializer(serializers.ModelSerializer):
+                        pass
+                """))
+        self.assertTrue(self.needs_import("""
+                from django.conf import settings
+                from rest_framework import serializers
+
+                if settings.DEBUG:
+                    class DebugSerializer(serializers.ModelSerializer):
+                        pass
+                """))
+        # Classes local to a function are not module attributes.
+        self.assertFalse(self.needs_import("""
+                from rest_framework import serializers
+
+                def build():
+                    class OrderSerializer(serializers.ModelSerializer):
+                        pass
+                    return OrderSerializer
+                """))
+
+    def test_classes_created_at_runtime(self):
+        self.assertTrue(self.needs_import("""
+                from rest_framework import serializers
+
+                OrderSerializer = type("OrderSerializer", (serializers.ModelSerializer,), {})
+                """))
+        self.assertFalse(self.needs_import("""
+                name = type("value")
+                """))
+
+    def test_results_are_cached_by_mtime(self):
+        source = "class Helper:\n    pass\n"
+        self.needs_import(source)
+        path = os.path.join(self.tmpdir.name, "module.py")
+        self.scanner.needs_import(path)
+        self.assertEqual(self.scanner.scans, 1)
+
+    def test_find_serializer_modules(self):
+        exporter = SerializersExporter(outdir=".", apps=[], enable_logs=False)
+        self.assertEqual(
+            exporter.find_serializer_modules(apps.get_app_config("tests")),
+            ["tests.serializers"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.emitter import TypeScriptEmitter
+from django_ts_exporter.enums import EnumRegistry, choices_enum, enum_content
+from django_ts_exporter.schema import Enum, Field, Interface
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class SharedEnumsTestCase(TestCase):
+    def export(self, **kwargs):
+        return SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            **kwargs
+        ).export()
+
+    def test_enums_are_inlined_by_default(self):
+        files = self.export()
+
+        self.assertIn(
+            "export enum ArticleSerializerStatusEnum",
+            files["tests/ArticleSerializer.ts"],
+        )
+        self.assertFalse(any(path.startswith("enums/") for path in files))
+
+    def test_shared_enums(self):
+        files = self.export(shared_enums=True)
+        article = files["tests/ArticleSerializer.ts"]
+
+        # Named after the TextChoices class, written once for both fields.
+        self.assertEqual(
+            files["enums/StatusEnum.ts"],
+            "export enum StatusEnum {\n  Draft = 'draft',\n  Published = 'published',\n}\n",
+        )
+        self.assertIn('import { StatusEnum } from "../enums/StatusEnum.ts";', article)
+        self.assertIn("status: StatusEnum;", article)
+        self.assertIn("review_status: StatusEnum;", article)
+        self.assertNotIn("export enum", article)
+
+        # Plain choices are named after the first field using them.
+        self.assertIn("enums/ArticleSerializerPriorityEnum.ts", files)
+        self.assertIn(
+            "priority: ArticleSerializerPriorityEnum;",
+            files["tests/ArticleSummarySerializer.ts"],
+        )
+
+    def test_shared_enums_bundle(self):
+        files = self.export(shared_enums=True, bundle="app")
+
+        self.assertIn("export enum StatusEnum", files["enums.ts"])
+        self.assertIn('from "./enums.ts";', files["tests.ts"])
+
+    def test_names_do_not_collide(self):
+        low = Enum("AEnum", (("Low", 1),))
+        high = Enum("AEnum", (("High", 2),))
+        registry = EnumRegistry(
+            [Interface("a", "a", "A", (Field("x", low), Field("y", high)))]
+        )
+
+        self.assertEqual(sorted(registry.names.values()), ["AEnum", "AEnum2"])
+
+    def test_suffixes_skip_taken_names(self):
+        low = Enum("AEnum", (("Low", 1),))
+        high = Enum("AEnum", (("High", 2),))
+        other = Enum("AEnum2", (("Other", 3),))
+        registry = EnumRegistry(
+            [
+                Interface(
+                    "a",
+                    "a",
+                    "A",
+                    (Field("x", low), Field("y", high), Field("z", other)),
+                )
+            ]
+        )
+
+        self.assertEqual(registry.names[enum_content(other)], "AEnum2")
+        self.assertEqual(sorted(registry.names.values()), ["AEnum", "AEnum2", "AEnum3"])
+
+
+class ChoiceEncodingTestCase(TestCase):
+    def test_keys_are_identifiers(self):
+        enum = choices_enum(
+            "DelayEnum",
+            [("a", "In review"), ("b", "1-2 days"), ("c", "In-review"), ("d", "")],
+        )
+
+        self.assertEqual(
+            [key for key, _ in enum.members],
+            ["In_review", "_1_2_days", "In_review2", "_"],
+        )
+        self.assertEqual(enum.labels, ("In review", "1-2 days", "In-review", ""))
+
+    def test_values_style(self):
+        enum = choices_enum("SizeEnum", [("s", "Small"), ("xl", "Extra 'large'")])
+
+        self.assertEqual(
+            TypeScriptEmitter("values", choice_labels=True).enum(enum),
+            "export const SizeEnumValues = [\n  's',\n  'xl',\n] as const;\n"
+            "export type SizeEnum = (typeof SizeEnumValues)[number];\n"
+            "export const SizeEnumLabels: Record<SizeEnum, string> = {\n"
+            "  's': 'Small',\n  'xl': 'Extra \\'large\\'',\n};\n",
+        )
+        self.assertEqual(
+            TypeScriptEmitter("values", declarations=True).enum(enum),
+            "export declare const SizeEnumValues: readonly ['s', 'xl'];\n"
+            "export type SizeEnum = (typeof SizeEnumValues)[number];\n",
+        )
+
+    def test_compact_choices(self):
+        files = SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            shared_enums=True,
+            compact_choices=1,
+        ).export()
+
+        # Status has two members.
+        self.assertIn("export const StatusEnumValues = [", files["enums/StatusEnum.ts"])
+        files = SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            shared_enums=True,
+            compact_choices=2,
+        ).export()
+        self.assertIn("export enum StatusEnum {", files["enums/StatusEnum.ts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
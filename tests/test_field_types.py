@@ -0,0 +1,73 @@
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from rest_framework import serializers
+from django_ts_exporter.field_types import FieldTypeRegistry, serializer_field_types
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class MoneyField(serializers.DecimalField):
+    pass
+
+
+class FieldTypeRegistryTestCase(TestCase):
+    def test_lookup_resolves_closest_registered_ancestor(self):
+        registry = FieldTypeRegistry()
+        registry.register(models.Field, "any")
+        registry.register(models.CharField, "string")
+
+        self.assertEqual(registry.lookup(models.EmailField), "string")
+        self.assertEqual(registry.lookup(models.TextField), "any")
+        self.assertIn(models.EmailField, registry.cache)
+
+        registry.register(models.EmailField, "Email")
+        self.assertEqual(registry.lookup(models.EmailField), "Email")
+
+    def test_one_to_one_uses_its_own_handler(self):
+        handler = ModelsExporter.field_types.lookup(models.OneToOneField)
+        self.assertIs(handler, ModelsExporter.get_related_field_type)
+
+    def test_default_registration_keeps_project_handlers(self):
+        registry = FieldTypeRegistry()
+        registry.register(models.CharField, "Slug")
+        registry.register_default(models.CharField, "string")
+        self.assertEqual(registry.lookup(models.CharField), "Slug")
+
+    def test_custom_serializer_field(self):
+        exporter = SerializersExporter(outdir=".", apps=[], enable_logs=False)
+        field = MoneyField(max_digits=10, decimal_places=2)
+
+        self.assertEqual(exporter.get_ts_type(field, "price", "tests", "X"), "number")
+
+        serializer_field_types.register(MoneyField, "string")
+        try:
+            self.assertEqual(
+                exporter.get_ts_type(field, "price", "tests", "X"), "string"
+            )
+        finally:
+            serializer_field_types.unregister(MoneyField)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import json
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.graph import GRAPH_FILENAME, DependencyGraph
+from django_ts_exporter.manifest import Manifest
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+APPS = ["django.contrib.contenttypes", "tests"]
+MODELS_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), "models.py"))
+
+
+class DependencyGraphTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def export(self, exporter_class=ModelsExporter, **kwargs):
+        exporter = exporter_class(
+            outdir=self.outdir, apps=APPS, enable_logs=False, incremental=True, **kwargs
+        )
+        exporter.export()
+        return exporter
+
+    def test_graph_is_persisted(self):
+        self.export()
+        graph = DependencyGraph.load(self.outdir, "models")
+
+        node = graph.nodes["tests.TestModel"]
+        self.assertEqual(node["file"], "tests/TestModel.ts")
+        self.assertEqual(node["imports"], ["tests.RelatedModel"])
+        self.assertEqual(node["sources"], [MODELS_PATH])
+        self.assertIn("tests.TestModel", graph.dependents()["tests.RelatedModel"])
+        # The graph of one source is never used for the other one.
+        self.assertIsNone(DependencyGraph.load(self.outdir, "serializers"))
+
+    def test_plain_exports_write_no_graph(self):
+        exporter = ModelsExporter(outdir=self.outdir, apps=APPS, enable_logs=False)
+        exporter.export()
+        self.assertFalse(os.path.exists(os.path.join(self.outdir, GRAPH_FILENAME)))
+        # Nor do they build it.
+        self.assertEqual(exporter.graph.nodes, {})
+
+    def test_only_regenerates_dependents(self):
+        self.export()
+        exporter = self.export(only=["tests.RelatedModel"])
+
+        self.assertEqual(
+            exporter.selection.node_ids,
+            {"tests.RelatedModel", "tests.TestModel", "tests.ProxyTestModel"},
+        )
+        self.assertEqual(
+            sorted(exporter.manifest.skipped),
+            ["tests/ProxyTestModel.ts", "tests/RelatedModel.ts", "tests/TestModel.ts"],
+        )
+        # Files outside the selection are neither rendered nor pruned.
+        self.assertEqual(exporter.manifest.removed, [])
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self.outdir, "django.contrib.contenttypes", "ContentType.ts"
+                )
+            )
+        )
+        graph = DependencyGraph.load(self.outdir, "models")
+        self.assertIn("contenttypes.ContentType", graph.nodes)
+        self.assertIn("tests.UnmanagedModel", graph.nodes)
+
+    def test_changed_files_prune_removed_classes(self):
+        self.export()
+        graph = DependencyGraph.load(self.outdir, "models")
+        graph.nodes["tests.GoneModel"] = dict(
+            graph.nodes["tests.RelatedModel"], file="tests/GoneModel.ts", imports=[]
+        )
+        graph.save(self.outdir)
+        manifest = Manifest(self.outdir)
+        manifest.write("tests/GoneModel.ts", "export interface GoneModel {}\n")
+        manifest.save()
+
+        exporter = self.export(changed_files=[MODELS_PATH])
+
+        self.assertEqual(exporter.manifest.removed, ["tests/GoneModel.ts"])
+        with open(os.path.join(self.outdir, GRAPH_FILENAME), encoding="utf-8") as f:
+            nodes = json.load(f)["nodes"]
+        self.assertNotIn("tests.GoneModel", nodes)
+        self.assertIn("contenttypes.ContentType", nodes)
+
+    def test_inline_serializers_depend_on_their_models(self):
+        self.export(SerializersExporter)
+        exporter = self.export(SerializersExporter, only=["tests.RelatedModel"])
+
+        self.assertIn("tests.RelatedModelSerializer", exporter.selection.node_ids)
+        # Meta.depth writes RelatedModel inline, without importing anything.
+        self.assertIn("tests.TestModelDepthSerializer", exporter.selection.node_ids)
+        self.assertNotIn("tests.TestModelMethodSerializer", exporter.selection.node_ids)
+
+    def test_partial_runs_only_import_what_they_need(self):
+        class RecordingExporter(SerializersExporter):
+            def import_module(self, module_name):
+                imported.append(module_name)
+                return super().import_module(module_name)
+
+        imported = []
+        self.export(RecordingExporter)
+        self.assertEqual(set(imported), {"tests.serializers"})
+
+        # No serializer is built from ContentType: nothing to import.
+        imported = []
+        self.export(RecordingExporter, only=["contenttypes.ContentType"])
+        self.assertEqual(imported, [])
+
+        # Relations resolve as in the full export, whose files are unchanged.
+        exporter = self.export(RecordingExporter, only=["tests.TestModel"])
+        self.assertIn("tests/TestModelSerializer.ts", exporter.manifest.skipped)
+        self.assertEqual(exporter.manifest.written, [])
+        related_model = apps.get_model("tests", "RelatedModel")
+        self.assertEqual(
+            exporter.index.serializer_for(related_model),
+            ("tests", "RelatedModelSerializer"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import json
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.manifest import MANIFEST_FILENAME, Manifest
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class IncrementalExportTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def export(self):
+        exporter = ModelsExporter(
+            outdir=self.outdir, apps=["tests"], enable_logs=False, incremental=True
+        )
+        exporter.export()
+        return exporter.manifest
+
+    def test_unchanged_files_are_not_rewritten(self):
+        first = self.export()
+        self.assertIn("tests/TestModel.ts", first.written)
+
+        path = os.path.join(self.outdir, "tests", "TestModel.ts")
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        second = self.export()
+        self.assertEqual(second.written, [])
+        self.assertIn("tests/TestModel.ts", second.skipped)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime_ns)
+
+    def test_edited_files_are_restored(self):
+        self.export()
+        path = os.path.join(self.outdir, "tests", "TestModel.ts")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("// edited by hand\n")
+
+        manifest = self.export()
+        self.assertEqual(manifest.written, ["tests/TestModel.ts"])
+
+    def test_orphaned_files_are_removed(self):
+        self.export()
+        manifest = Manifest(self.outdir)
+        manifest.write("gone/RemovedModel.ts", "export interface RemovedModel {}\n")
+        manifest.save()
+
+        manifest = self.export()
+        self.assertEqual(manifest.removed, ["gone/RemovedModel.ts"])
+        self.assertFalse(os.path.exists(os.path.join(self.outdir, "gone")))
+
+        with open(os.path.join(self.outdir, MANIFEST_FILENAME), encoding="utf-8") as f:
+            self.assertNotIn("gone/RemovedModel.ts", json.load(f)["files"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.index import TypeIndex
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.schema import Reference
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+from tests import serializers as test_serializers  # noqa: E402
+from django.contrib.auth.models import Group  # noqa: E402
+from tests import models as test_models  # noqa: E402
+
+
+class TypeIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = TypeIndex()
+        self.tests_app = apps.get_app_config("tests")
+        self.index.add_app(self.tests_app)
+        self.index.add_app(apps.get_app_config("auth"))
+
+    def test_output_dirs_are_named_after_apps(self):
+        self.assertEqual(self.index.output_dir("auth"), "django.contrib.auth")
+        self.assertEqual(self.index.output_dir("tests"), "tests")
+        self.assertEqual(self.index.output_dir("otherapp"), "otherapp")
+
+    def test_resolve_lazy_references(self):
+        self.assertIs(
+            self.index.resolve_model("tests.RelatedModel", "tests"),
+            test_models.RelatedModel,
+        )
+        self.assertIs(
+            self.index.resolve_model("RelatedModel", "tests"), test_models.RelatedModel
+        )
+        self.assertIs(
+            self.index.resolve_model(test_models.TestModel, "tests"),
+            test_models.TestModel,
+        )
+        self.assertIsNone(self.index.resolve_model("otherapp.Model", "tests"))
+
+    def test_serializer_for_prefers_naming_convention(self):
+        self.index.add_serializer(
+            self.tests_app,
+            "ArticleSummarySerializer",
+            test_serializers.ArticleSummarySerializer,
+        )
+        self.assertEqual(
+            self.index.serializer_for(test_models.Article),
+            ("tests", "ArticleSummarySerializer"),
+        )
+        self.index.add_serializer(
+            self.tests_app, "ArticleSerializer", test_serializers.ArticleSerializer
+        )
+        self.assertEqual(
+            self.index.serializer_for(test_models.Article),
+            ("tests", "ArticleSerializer"),
+        )
+        self.assertIsNone(self.index.serializer_for(test_models.RelatedModel))
+
+
+class RelationResolutionTestCase(TestCase):
+    def test_models_lazy_references(self):
+        exporter = ModelsExporter(outdir="unused", apps=["tests"], enable_logs=False)
+        self.assertEqual(
+            exporter.get_related_type("tests.RelatedModel", "tests"),
+            Reference("RelatedModel", "tests"),
+        )
+        self.assertEqual(
+            exporter.get_related_type("otherapp.Model", "tests"),
+            Reference("Model", "otherapp"),
+        )
+
+    def test_serializer_without_naming_convention(self):
+        exporter = SerializersExporter(
+            outdir="unused", apps=["tests"], enable_logs=False
+        )
+        index = exporter.type_index()
+        del index.model_serializers[test_models.RelatedModel]
+        index.add_serializer(
+            apps.get_app_config("tests"),
+            "RelatedSerializer",
+            test_serializers.RelatedModelSerializer,
+        )
+        self.assertEqual(
+            exporter.get_model_serializer_type(test_models.RelatedModel),
+            Reference("RelatedSerializer", "tests"),
+        )
+        # Models without an exported serializer keep the conventional name.
+        self.assertEqual(
+            exporter.get_model_serializer_type(Group),
+            Reference("GroupSerializer", "auth"),
+        )
+
+    def test_imports_within_app_named_differently_from_label(self):
+        files = ModelsExporter(
+            outdir="unused",
+            apps=["django.contrib.auth"],
+            enable_logs=False,
+            sink=MemorySink(),
+        ).export()
+        self.assertIn(
+            'import { Group } from "./Group.ts";', files["django.contrib.auth/User.ts"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
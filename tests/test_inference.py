@@ -0,0 +1,80 @@
+import typing
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.diagnostics import MemoryDiagnostics
+from django_ts_exporter.inference import (
+    SourceCache,
+    infer_return_type,
+    python_type_to_ts,
+)
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+from tests import serializers as test_serializers  # noqa: E402
+
+
+class InferenceTestCase(TestCase):
+    def test_python_type_to_ts(self):
+        self.assertEqual(python_type_to_ts(typing.List[int]), "number[]")
+        self.assertEqual(python_type_to_ts(typing.Optional[str]), "string | null")
+        self.assertEqual(
+            python_type_to_ts(typing.List[typing.Optional[int]]), "(number | null)[]"
+        )
+        self.assertEqual(
+            python_type_to_ts(typing.Dict[str, bool]), "{ [key: string]: boolean }"
+        )
+        self.assertEqual(python_type_to_ts(typing.Tuple[int, str]), "[number, string]")
+        self.assertEqual(python_type_to_ts(typing.Literal["a", "b"]), "'a' | 'b'")
+
+    def test_method_fields(self):
+        diagnostics = MemoryDiagnostics()
+        exporter = SerializersExporter(
+            outdir=".", apps=[], enable_logs=False, diagnostics=diagnostics
+        )
+        ts_interface, _ = exporter.convert_serializer_to_ts_interface(
+            "TestModelMethodSerializer",
+            test_serializers.TestModelMethodSerializer,
+            "tests",
+        )
+
+        self.assertIn("tags: number[];", ts_interface)
+        self.assertIn("nickname: string | null;", ts_interface)
+        self.assertIn("scores: { [key: string]: number };", ts_interface)
+        self.assertIn("is_recent: boolean;", ts_interface)
+        self.assertIn("summary: { [key: string]: any } | null;", ts_interface)
+        self.assertIn("status: string;", ts_interface)
+        self.assertIn("unknown: any;", ts_interface)
+        self.assertEqual(
+            diagnostics.any_fields, ["tests.TestModelMethodSerializer.unknown"]
+        )
+
+    def test_modules_are_parsed_once(self):
+        cache = SourceCache()
+        serializer = test_serializers.TestModelMethodSerializer
+        for method in ("get_is_recent", "get_summary", "get_status"):
+            infer_return_type(getattr(serializer, method), cache)
+
+        self.assertEqual(cache.parses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
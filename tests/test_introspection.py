@@ -0,0 +1,119 @@
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from rest_framework import serializers
+from django_ts_exporter.diagnostics import MemoryDiagnostics
+from django_ts_exporter.introspection import IntrospectionCache
+from django_ts_exporter.schema import Field
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+from tests import serializers as test_serializers  # noqa: E402
+
+
+class IntrospectionTestCase(TestCase):
+    def setUp(self):
+        self.exporter = SerializersExporter(outdir=".", apps=[], enable_logs=False)
+
+    def test_depth_nested_serializers_are_inlined_once(self):
+        ts_interface, imports = self.exporter.convert_serializer_to_ts_interface(
+            "TestModelDepthSerializer",
+            test_serializers.TestModelDepthSerializer,
+            "tests",
+        )
+
+        self.assertIn("foreign_key: { id: number; name: string; };", ts_interface)
+        self.assertIn("one_to_one: { id: number; name: string; };", ts_interface)
+        self.assertEqual(imports, [])
+        # One entry for the serializer itself, one shared by both nested fields.
+        self.assertEqual(len(self.exporter.introspection.resolved), 2)
+
+    def test_plain_nested_serializers(self):
+        ts_interface, imports = self.exporter.convert_serializer_to_ts_interface(
+            "TestModelSummarySerializer",
+            test_serializers.TestModelSummarySerializer,
+            "tests",
+        )
+
+        self.assertIn("summary: { total: number; label: string; };", ts_interface)
+        self.assertIn("history: { total: number; label: string; }[];", ts_interface)
+        self.assertIn("related: RelatedModelSerializer;", ts_interface)
+        self.assertEqual([i.name for i in imports], ["RelatedModelSerializer"])
+
+    def test_fields_are_introspected_once(self):
+        cache = IntrospectionCache()
+        serializer = test_serializers.SummarySerializer
+        self.assertIs(cache.get_fields(serializer), cache.get_fields(serializer))
+
+    def test_cycles_are_detected(self):
+        cache = IntrospectionCache()
+        serializer = test_serializers.SummarySerializer
+        inner = []
+
+        def resolver():
+            inner.append(cache.resolve(serializer, resolver))
+            return "resolved"
+
+        self.assertEqual(cache.resolve(serializer, resolver), "resolved")
+        self.assertEqual(inner, [None])
+        self.assertEqual(cache.cycles, [["SummarySerializer", "SummarySerializer"]])
+
+    def test_cycles_are_reported(self):
+        class TreeSerializer(serializers.Serializer):
+            name = serializers.CharField()
+
+        # A serializer nesting itself, as declared with a late-bound field.
+        TreeSerializer._declared_fields["parent"] = TreeSerializer()
+        diagnostics = MemoryDiagnostics()
+        exporter = SerializersExporter(
+            outdir="unused", apps=["tests"], enable_logs=False, diagnostics=diagnostics
+        )
+
+        ts_type = exporter.get_inline_serializer_type(TreeSerializer, "tests")
+
+        self.assertEqual(
+            ts_type.fields, (Field("name", "string"), Field("parent", "any"))
+        )
+        self.assertEqual(diagnostics.cycles, [["TreeSerializer", "TreeSerializer"]])
+
+    def test_export(self):
+        with tempfile.TemporaryDirectory() as outdir:
+            diagnostics = MemoryDiagnostics()
+            exporter = SerializersExporter(
+                outdir=outdir,
+                apps=["tests"],
+                enable_logs=False,
+                diagnostics=diagnostics,
+            )
+            exporter.export()
+
+        # Bound fields are dropped once resolved, and nested serializers are
+        # only tracked for the dependency graph, which plain exports skip.
+        self.assertEqual(exporter.introspection.fields, {})
+        self.assertEqual(exporter.introspection.dependencies, {})
+        for field in diagnostics.any_fields:
+            self.assertNotIn("Depth", field)
+            self.assertNotIn("Summary", field)
+
+
+if __name__ == "__main__":
+    unittest.main()
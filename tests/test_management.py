@@ -0,0 +1,118 @@
+import io
+import os
+from contextlib import redirect_stdout
+import tempfile
+import unittest
+from django.test import TestCase, override_settings
+from django.apps import apps
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django_ts_exporter.apps import export_on_reload
+from django_ts_exporter.management.commands.export_ts import Command
+from constants.models_exporter import MODELS_INTERFACE
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@override_settings(BASE_DIR=BASE_DIR)
+class ExportCommandTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = os.path.join(self.tmpdir.name, "typescript")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read(self, relpath):
+        with open(os.path.join(self.outdir, relpath), encoding="utf-8") as f:
+            return f.read()
+
+    def test_export_command(self):
+        call_command(Command(), "--source", "models", "--outdir", self.outdir)
+
+        self.assertEqual(
+            self.read("tests/TestModel.ts").strip(), MODELS_INTERFACE.strip()
+        )
+
+    def test_invalid_options(self):
+        with self.assertRaises(CommandError):
+            call_command(Command(), "--stdout", "--incremental", stdout=io.StringIO())
+
+    def test_check(self):
+        call_command(Command(), "--source", "models", "--outdir", self.outdir)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            call_command(Command(), "-s", "models", "-o", self.outdir, "--check")
+        self.assertIn("is up to date", output.getvalue())
+
+        os.remove(os.path.join(self.outdir, "tests", "TestModel.ts"))
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(CommandError):
+            call_command(Command(), "-s", "models", "-o", self.outdir, "--check")
+        self.assertIn("A tests/TestModel.ts\n", output.getvalue())
+        self.assertFalse(
+            os.path.exists(os.path.join(self.outdir, "tests", "TestModel.ts"))
+        )
+
+    def test_source_all(self):
+        call_command(Command(), "--source", "all", "--outdir", self.outdir)
+
+        self.assertEqual(
+            self.read("models/tests/TestModel.ts").strip(), MODELS_INTERFACE.strip()
+        )
+        self.assertIn(
+            "export interface TestModelSerializer {",
+            self.read("serializers/tests/TestModelSerializer.ts"),
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.outdir, "tests")))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            call_command(Command(), "-s", "all", "-o", self.outdir, "--check")
+        self.assertIn("is up to date", output.getvalue())
+
+    def test_source_all_stdout(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            call_command(Command(), "--source", "all", "--stdout")
+        self.assertIn("// models/tests/TestModel.ts\n", output.getvalue())
+        self.assertIn(
+            "// serializers/tests/TestModelSerializer.ts\n", output.getvalue()
+        )
+
+    def test_export_on_reload(self):
+        with override_settings(
+            TS_EXPORTER_RUNSERVER_ARGS=["-s", "models", "-o", self.outdir]
+        ):
+            export_on_reload(sender=None).join()
+
+        self.assertEqual(
+            self.read("tests/TestModel.ts").strip(), MODELS_INTERFACE.strip()
+        )
+        # Reloads export incrementally, so unchanged files are left alone.
+        self.assertTrue(
+            os.path.exists(os.path.join(self.outdir, ".ts-exporter-manifest.json"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,6 +38,37 @@ class ModelsExporterTestCase(TestCase):
 
         self.assertEqual(content.strip(), expected_content.strip())
 
+    def test_models_come_from_the_app_registry(self):
+        exporter = ModelsExporter(
+            outdir="./tests/typescript/", apps=["tests"], enable_logs=False
+        )
+        names = [interface.name for interface in exporter.render_app("tests")]
+
+        self.assertEqual(
+            names,
+            [
+                "Article",
+                "ProxyTestModel",
+                "RelatedModel",
+                "TestModel",
+                "UnmanagedModel",
+            ],
+        )
+
+    def test_included_apps(self):
+        exporter = ModelsExporter(
+            outdir="./tests/typescript/",
+            apps=["django.contrib.auth"],
+            enable_logs=False,
+        )
+        interfaces = exporter.render_app("django.contrib.auth")
+
+        self.assertEqual(
+            [interface.name for interface in interfaces],
+            ["Group", "Permission", "User"],
+        )
+        self.assertEqual(interfaces[0].app_label, "auth")
+
 
 if __name__ == "__main__":
     unittest.main()
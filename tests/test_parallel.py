@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.diagnostics import MemoryDiagnostics
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.serializers_exporter import SerializersExporter
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+APPS = ["django.contrib.contenttypes", "django.contrib.auth", "tests"]
+
+
+def read_tree(outdir):
+    tree = {}
+    for root, _, files in os.walk(outdir):
+        for file in files:
+            path = os.path.join(root, file)
+            with open(path, "rb") as f:
+                tree[os.path.relpath(path, outdir)] = f.read()
+    return tree
+
+
+class ParallelExportTestCase(TestCase):
+    def export(self, exporter_class, jobs):
+        with tempfile.TemporaryDirectory() as outdir:
+            diagnostics = MemoryDiagnostics()
+            exporter = exporter_class(
+                outdir=outdir,
+                apps=APPS,
+                enable_logs=False,
+                jobs=jobs,
+                diagnostics=diagnostics,
+            )
+            exporter.export()
+            return read_tree(outdir), diagnostics.any_fields
+
+    def test_parallel_output_matches_serial(self):
+        for exporter_class in (ModelsExporter, SerializersExporter):
+            with self.subTest(exporter=exporter_class.__name__):
+                serial_tree, serial_log = self.export(exporter_class, jobs=1)
+                parallel_tree, parallel_log = self.export(exporter_class, jobs=2)
+
+                self.assertTrue(serial_tree)
+                self.assertEqual(parallel_tree, serial_tree)
+                self.assertEqual(parallel_log, serial_log)
+
+
+if __name__ == "__main__":
+    unittest.main()
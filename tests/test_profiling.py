@@ -0,0 +1,84 @@
+import os
+import json
+import pstats
+import tempfile
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.profiling import Profiler
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class ProfilingTestCase(TestCase):
+    def profile(self, jobs=1, dump_path=None):
+        profiler = Profiler(top=2, dump_path=dump_path)
+        profiler.start()
+        files = SerializersExporter(
+            outdir="unused",
+            apps=["django.contrib.auth", "tests"],
+            enable_logs=False,
+            jobs=jobs,
+            sink=MemorySink(),
+            profiler=profiler,
+        ).export()
+        profiler.stop()
+        return profiler, files
+
+    def test_report(self):
+        profiler, files = self.profile()
+        report = profiler.report()
+
+        self.assertIn("render", report["phases"])
+        self.assertIn("introspection", report["phases"])
+        self.assertIn("inference", report["phases"])
+        self.assertEqual(set(report["apps"]), {"django.contrib.auth", "tests"})
+        self.assertEqual(len(report["slowest"]["serializer"]), 2)
+        self.assertEqual(report["files"]["written"], len(files))
+        self.assertEqual(
+            report["files"]["bytes_written"],
+            sum(len(content.encode("utf-8")) for content in files.values()),
+        )
+        self.assertGreater(report["peak_memory"], 0)
+        # Phases are exclusive, so together they never exceed the wall time.
+        self.assertLessEqual(sum(report["phases"].values()), report["total"])
+
+    def test_parallel_timings_are_merged(self):
+        profiler, _ = self.profile(jobs=2)
+
+        self.assertEqual(set(profiler.apps), {"django.contrib.auth", "tests"})
+        self.assertIn("serializer", profiler.items)
+
+    def test_json_report_and_cprofile_dump(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dump_path = os.path.join(tmpdir, "export.prof")
+            report_path = os.path.join(tmpdir, "profile.json")
+            profiler, _ = self.profile(dump_path=dump_path)
+            profiler.write_report(report_path)
+
+            with open(report_path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["apps"].keys(), profiler.apps.keys())
+            self.assertTrue(pstats.Stats(dump_path).total_calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from django.test import TestCase, override_settings
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.reachability import api_serializers
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.sinks import MemorySink
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+from tests import serializers as test_serializers  # noqa: E402
+
+
+@override_settings(ROOT_URLCONF="tests.urls")
+class ReachabilityTestCase(TestCase):
+    def test_api_serializers(self):
+        self.assertEqual(
+            api_serializers(),
+            {
+                test_serializers.ArticleSerializer,
+                test_serializers.ArticleSummarySerializer,
+                test_serializers.TestModelSummarySerializer,
+                test_serializers.SummarySerializer,
+            },
+        )
+
+    def test_reachable_only(self):
+        files = SerializersExporter(
+            outdir="unused",
+            apps=["tests"],
+            enable_logs=False,
+            sink=MemorySink(),
+            reachable_only=True,
+        ).export()
+
+        # RelatedModelSerializer is nested in TestModelSummarySerializer.
+        self.assertEqual(
+            sorted(files),
+            [
+                "tests/ArticleSerializer.ts",
+                "tests/ArticleSummarySerializer.ts",
+                "tests/RelatedModelSerializer.ts",
+                "tests/TestModelSummarySerializer.ts",
+            ],
+        )
+
+    def test_output_is_unchanged(self):
+        def export(reachable_only):
+            return SerializersExporter(
+                outdir="unused",
+                apps=["tests"],
+                enable_logs=False,
+                sink=MemorySink(),
+                reachable_only=reachable_only,
+            ).export()
+
+        everything = export(False)
+        for relpath, content in export(True).items():
+            self.assertEqual(content, everything[relpath])
+
+
+if __name__ == "__main__":
+    unittest.main()
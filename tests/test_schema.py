@@ -0,0 +1,110 @@
+import pickle
+import unittest
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.emitter import TypeScriptEmitter
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.schema import (
+    Array,
+    Enum,
+    Field,
+    InlineObject,
+    Interface,
+    Raw,
+    Reference,
+    from_handler_result,
+)
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+ORDER = Interface(
+    "shop",
+    "shop",
+    "Order",
+    (
+        Field("id", "number"),
+        Field("status", Enum("OrderStatusEnum", (("Open", "open"),))),
+        Field("items", Array(Reference("Item", "shop"))),
+        Field("parent", Reference("Order", "shop")),
+        Field("total", InlineObject((Field("amount", "number"),))),
+        Field("customer", Raw("Customer | null", (Reference("Customer", "crm"),))),
+    ),
+)
+
+
+class SchemaTestCase(TestCase):
+    def test_nodes_are_comparable_and_picklable(self):
+        self.assertEqual(pickle.loads(pickle.dumps(ORDER)), ORDER)
+        self.assertEqual(len({ORDER, ORDER._replace()}), 1)
+        self.assertFalse(hasattr(ORDER.fields[0], "__dict__"))
+
+    def test_references_and_enums(self):
+        self.assertEqual(
+            ORDER.references,
+            [Reference("Customer", "crm"), Reference("Item", "shop")],
+        )
+        self.assertEqual(ORDER.enums, {Enum("OrderStatusEnum", (("Open", "open"),))})
+
+    def test_emitter(self):
+        emitter = TypeScriptEmitter()
+
+        self.assertEqual(
+            emitter.interface(ORDER),
+            "export enum OrderStatusEnum {\n  Open = 'open',\n}\n\n\n"
+            "export interface Order {\n"
+            "  id: number;\n"
+            "  status: OrderStatusEnum;\n"
+            "  items: Item[];\n"
+            "  parent: Order;\n"
+            "  total: { amount: number; };\n"
+            "  customer: Customer | null;\n"
+            "}\n\n",
+        )
+        self.assertEqual(
+            emitter.imports(ORDER.references, "shop"),
+            'import { Customer } from "../crm/Customer.ts";\n'
+            'import { Item } from "./Item.ts";',
+        )
+
+    def test_legacy_handler_results(self):
+        reference = Reference("Item", "shop")
+
+        self.assertEqual(from_handler_result(("string", None)), "string")
+        self.assertEqual(from_handler_result(("Item", reference)), reference)
+        self.assertEqual(from_handler_result(("Item[]", reference)), Array(reference))
+        self.assertEqual(from_handler_result(reference), reference)
+
+    def test_model_interface(self):
+        exporter = ModelsExporter(outdir=".", apps=[], enable_logs=False)
+        interface = exporter.build_model_interface(
+            "TestModel",
+            apps.get_model("tests", "TestModel"),
+            apps.get_app_config("tests"),
+        )
+
+        fields = dict(interface.fields)
+        self.assertEqual(
+            fields["many_to_many"], Array(Reference("RelatedModel", "tests"))
+        )
+        self.assertEqual(interface.models, ("tests.TestModel",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from django.test import TestCase
+from django.apps import apps
+from django.conf import settings
+from django_ts_exporter.models_exporter import ModelsExporter
+from django_ts_exporter.sinks import (
+    ArchiveSink,
+    CheckSink,
+    Drift,
+    MemorySink,
+    StdoutSink,
+)
+from constants.models_exporter import MODELS_INTERFACE
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+
+class SinksTestCase(TestCase):
+    def export(self, sink):
+        return ModelsExporter(
+            outdir="unused", apps=["tests"], enable_logs=False, sink=sink
+        ).export()
+
+    def test_memory_sink(self):
+        files = self.export(MemorySink())
+
+        self.assertIn("tests/RelatedModel.ts", files)
+        self.assertEqual(files["tests/TestModel.ts"].strip(), MODELS_INTERFACE.strip())
+        self.assertFalse(os.path.exists("unused"))
+
+    def test_stdout_sink(self):
+        stream = io.StringIO()
+        self.export(StdoutSink(stream))
+
+        self.assertIn("// tests/TestModel.ts\n", stream.getvalue())
+        self.assertIn("export interface TestModel {", stream.getvalue())
+
+    def test_archive_sinks(self):
+        expected = self.export(MemorySink())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tar_path = os.path.join(tmpdir, "types.tar.gz")
+            self.export(ArchiveSink(tar_path))
+            with tarfile.open(tar_path) as archive:
+                files = {
+                    member.name: archive.extractfile(member).read().decode("utf-8")
+                    for member in archive.getmembers()
+                }
+            self.assertEqual(files, expected)
+
+            zip_path = os.path.join(tmpdir, "types.zip")
+            self.export(ArchiveSink(zip_path))
+            with zipfile.ZipFile(zip_path) as archive:
+                files = {
+                    name: archive.read(name).decode("utf-8")
+                    for name in archive.namelist()
+                }
+            self.assertEqual(files, expected)
+
+    def test_check_sink(self):
+        with tempfile.TemporaryDirectory() as outdir:
+            ModelsExporter(outdir=outdir, apps=["tests"], enable_logs=False).export()
+            self.assertEqual(self.export(CheckSink(outdir)), Drift([], [], []))
+
+            with open(os.path.join(outdir, "tests", "TestModel.ts"), "a") as f:
+                f.write("// edited\n")
+            os.remove(os.path.join(outdir, "tests", "RelatedModel.ts"))
+            with open(os.path.join(outdir, "tests", "Stale.ts"), "w") as f:
+                f.write("")
+            with open(os.path.join(outdir, ".ts-exporter-manifest.json"), "w") as f:
+                f.write("{}")
+
+            self.assertEqual(
+                self.export(CheckSink(outdir)),
+                Drift(
+                    ["tests/TestModel.ts"],
+                    ["tests/RelatedModel.ts"],
+                    ["tests/Stale.ts"],
+                ),
+            )
+            self.assertFalse(
+                os.path.exists(os.path.join(outdir, "tests", "RelatedModel.ts"))
+            )
+
+    def test_unknown_archive_format(self):
+        with self.assertRaises(ValueError):
+            ArchiveSink("types.rar")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from django_ts_exporter.stamp import STAMP_FILENAME, Stamp
+
+OPTIONS = {"source": "models", "exclude": []}
+
+
+class StampTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.outdir = os.path.join(self.root, "typescript")
+        self.models = os.path.join(self.root, "shop", "models.py")
+        os.makedirs(os.path.dirname(self.models))
+        with open(self.models, "w", encoding="utf-8") as f:
+            f.write("")
+        os.makedirs(self.outdir)
+        self.output = os.path.join(self.outdir, "Order.ts")
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write("export interface Order {}\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def stamp(self, options=OPTIONS):
+        return Stamp(self.outdir, self.root, None, options)
+
+    def touch(self, path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    def test_missing_stamp(self):
+        self.assertFalse(self.stamp().is_current())
+
+    def test_nothing_changed(self):
+        self.stamp().save()
+
+        self.assertTrue(os.path.exists(os.path.join(self.outdir, STAMP_FILENAME)))
+        self.assertTrue(self.stamp().is_current())
+
+    def test_changed_source(self):
+        self.stamp().save()
+        self.touch(self.models)
+
+        self.assertFalse(self.stamp().is_current())
+
+    def test_ignored_directories(self):
+        node_modules = os.path.join(self.root, "node_modules")
+        os.makedirs(node_modules)
+        self.stamp().save()
+        with open(os.path.join(node_modules, "setup.py"), "w") as f:
+            f.write("")
+
+        self.assertTrue(self.stamp().is_current())
+
+    def test_changed_options(self):
+        self.stamp().save()
+
+        self.assertFalse(self.stamp(dict(OPTIONS, source="serializers")).is_current())
+
+    def test_changed_output(self):
+        self.stamp().save()
+        self.touch(self.output)
+
+        self.assertFalse(self.stamp().is_current())
+
+    def test_sources_are_taken_before_exporting(self):
+        stamp = self.stamp()
+        self.touch(self.models)
+        stamp.save()
+
+        self.assertFalse(self.stamp().is_current())
+
+
+if __name__ == "__main__":
+    unittest.main()
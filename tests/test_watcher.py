@@ -0,0 +1,175 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from django.apps import apps
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django_ts_exporter.manifest import Manifest
+from django_ts_exporter.serializers_exporter import SerializersExporter
+from django_ts_exporter.watcher import Watcher
+
+# Configure settings for the Django test environment if not already configured
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "tests",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        },
+    )
+
+apps.populate(settings.INSTALLED_APPS)
+
+SERIALIZERS = """from rest_framework import serializers
+from tests.models import RelatedModel, TestModel
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TestModel
+        fields = {fields}
+"""
+
+COUPON_SERIALIZER = """
+
+class CouponSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RelatedModel
+        fields = ["name"]
+"""
+
+
+class FakeExporter:
+    def __init__(self, path):
+        self.apps = ["shop"]
+        self.app_config = SimpleNamespace(name="project.shop", path=path)
+
+    def get_app_config(self, app):
+        return self.app_config
+
+
+class WatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.tmpdir.name
+        os.makedirs(os.path.join(self.path, "serializers"))
+        os.makedirs(os.path.join(self.path, "migrations"))
+        self.touch("models.py")
+        self.touch("serializers/__init__.py")
+        self.watcher = Watcher(FakeExporter(self.path))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def touch(self, relpath, content=""):
+        with open(os.path.join(self.path, relpath), "w") as f:
+            f.write(content)
+
+    def test_poll_reports_changed_files_per_app(self):
+        self.assertEqual(self.watcher.poll(), {})
+
+        self.touch("serializers/orders.py")
+        self.touch("migrations/0001_initial.py")
+        changed = self.watcher.poll()
+
+        self.assertEqual(
+            changed, {"shop": [os.path.join(self.path, "serializers", "orders.py")]}
+        )
+        self.assertEqual(self.watcher.poll(), {})
+
+    def test_module_name(self):
+        app_config = self.watcher.app_configs["shop"]
+        self.assertEqual(
+            self.watcher.module_name(app_config, os.path.join(self.path, "models.py")),
+            "project.shop.models",
+        )
+        self.assertEqual(
+            self.watcher.module_name(
+                app_config, os.path.join(self.path, "serializers", "__init__.py")
+            ),
+            "project.shop.serializers",
+        )
+
+
+class WatcherRefreshTestCase(TestCase):
+    app = "watched_shop"
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = os.path.join(self.tmpdir.name, "typescript")
+        self.app_path = os.path.join(self.tmpdir.name, self.app)
+        os.makedirs(self.app_path)
+        self.write("__init__.py", "")
+        self.write(
+            "serializers.py",
+            SERIALIZERS.format(fields=["integer_field"]) + COUPON_SERIALIZER,
+        )
+
+        sys.path.insert(0, self.tmpdir.name)
+        installed_apps = override_settings(
+            INSTALLED_APPS=settings.INSTALLED_APPS + [self.app]
+        )
+        installed_apps.enable()
+        self.addCleanup(installed_apps.disable)
+
+    def tearDown(self):
+        sys.path.remove(self.tmpdir.name)
+        for name in [name for name in sys.modules if name.startswith(self.app)]:
+            del sys.modules[name]
+        self.tmpdir.cleanup()
+
+    def write(self, relpath, content):
+        path = os.path.join(self.app_path, relpath)
+        with open(path, "w") as f:
+            f.write(content)
+        # Make the change visible whatever the resolution of file times.
+        mtime = os.stat(path).st_mtime + 10
+        os.utime(path, (mtime, mtime))
+
+    def read(self, name):
+        with open(os.path.join(self.outdir, self.app, f"{name}.ts")) as f:
+            return f.read()
+
+    def test_refresh_reexports_changed_app(self):
+        exporter = SerializersExporter(
+            outdir=self.outdir, apps=[self.app], enable_logs=False, incremental=True
+        )
+        exporter.export()
+        watcher = Watcher(exporter, enable_logs=True)
+        self.assertNotIn("char_field", self.read("OrderSerializer"))
+
+        self.write(
+            "serializers.py",
+            SERIALIZERS.format(fields=["integer_field", "char_field"]),
+        )
+        changed = watcher.poll()
+        self.assertEqual(list(changed), [self.app])
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            watcher.refresh(changed)
+
+        self.assertIn(f"Reloaded {self.app}.serializers", output.getvalue())
+        self.assertIn(f"Exported {self.app}", output.getvalue())
+        self.assertIn("char_field: string;", self.read("OrderSerializer"))
+        # The file of the deleted serializer is pruned through the manifest.
+        coupon = f"{self.app}/CouponSerializer.ts"
+        self.assertFalse(os.path.exists(os.path.join(self.outdir, coupon)))
+        self.assertEqual(exporter.manifest.removed, [coupon])
+        self.assertEqual(
+            set(Manifest(self.outdir).entries), {f"{self.app}/OrderSerializer.ts"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
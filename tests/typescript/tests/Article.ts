@@ -0,0 +1,7 @@
+export interface Article {
+  id: number;
+  status: string;
+  review_status: string;
+  priority: number;
+}
+
@@ -0,0 +1,23 @@
+export enum ArticleSerializerPriorityEnum {
+  Low = '1',
+  High = '2',
+}
+
+export enum ArticleSerializerReview_statusEnum {
+  Draft = 'draft',
+  Published = 'published',
+}
+
+export enum ArticleSerializerStatusEnum {
+  Draft = 'draft',
+  Published = 'published',
+}
+
+
+export interface ArticleSerializer {
+  id: number;
+  status: ArticleSerializerStatusEnum;
+  review_status: ArticleSerializerReview_statusEnum;
+  priority: ArticleSerializerPriorityEnum;
+}
+
@@ -0,0 +1,16 @@
+export enum ArticleSummarySerializerPriorityEnum {
+  Low = '1',
+  High = '2',
+}
+
+export enum ArticleSummarySerializerStatusEnum {
+  Draft = 'draft',
+  Published = 'published',
+}
+
+
+export interface ArticleSummarySerializer {
+  status: ArticleSummarySerializerStatusEnum;
+  priority: ArticleSummarySerializerPriorityEnum;
+}
+
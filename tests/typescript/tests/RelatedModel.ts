@@ -0,0 +1,5 @@
+export interface RelatedModel {
+  id: number;
+  name: string;
+}
+
@@ -0,0 +1,5 @@
+export interface RelatedModelSerializer {
+  id: number;
+  name: string;
+}
+
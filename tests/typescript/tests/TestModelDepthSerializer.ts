@@ -0,0 +1,6 @@
+export interface TestModelDepthSerializer {
+  id: number;
+  foreign_key: { id: number; name: string; };
+  one_to_one: { id: number; name: string; };
+}
+
@@ -0,0 +1,11 @@
+export interface TestModelMethodSerializer {
+  id: number;
+  tags: number[];
+  nickname: string | null;
+  scores: { [key: string]: number };
+  is_recent: boolean;
+  summary: { [key: string]: any } | null;
+  status: string;
+  unknown: any;
+}
+
@@ -0,0 +1,9 @@
+import { RelatedModelSerializer } from "./RelatedModelSerializer.ts";
+
+export interface TestModelSummarySerializer {
+  id: number;
+  summary: { total: number; label: string; };
+  history: { total: number; label: string; }[];
+  related: RelatedModelSerializer;
+}
+
@@ -0,0 +1,5 @@
+export interface UnmanagedModel {
+  id: number;
+  name: string;
+}
+
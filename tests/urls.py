@@ -0,0 +1,36 @@
+from django.urls import include, path
+from rest_framework import generics, routers, viewsets
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from . import serializers
+from .models import Article, TestModel
+
+
+class ArticleViewSet(viewsets.ModelViewSet):
+    queryset = Article.objects.all()
+    serializer_class = serializers.ArticleSerializer
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return serializers.ArticleSummarySerializer
+        return super().get_serializer_class()
+
+
+class TestModelSummaryView(generics.RetrieveAPIView):
+    queryset = TestModel.objects.all()
+    serializer_class = serializers.TestModelSummarySerializer
+
+
+@api_view(["GET"])
+def summary(request):
+    return Response(serializers.SummarySerializer({"total": 0, "label": ""}).data)
+
+
+router = routers.SimpleRouter()
+router.register("articles", ArticleViewSet)
+
+urlpatterns = [
+    path("api/", include(router.urls)),
+    path("summaries/<int:pk>/", TestModelSummaryView.as_view()),
+    path("summary/", summary),
+]